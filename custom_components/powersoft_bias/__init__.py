@@ -1,12 +1,26 @@
 """The Powersoft Bias Amplifier integration."""
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import time
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import wraps
+from itertools import chain
+from typing import Any
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_DEVICE_ID, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .bias_http_client import BiasHTTPClient
@@ -19,8 +33,11 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    PRESET_SYNC_COOLDOWN,
+    MAX_IDLE_SCAN_INTERVAL,
+    DEVICE_INFO_REFRESH_INTERVAL,
+    SIGNAL_SCENES_UPDATED,
     MAX_CHANNELS,
-    MAX_OUTPUT_EQ_BANDS,
     MAX_PRE_OUTPUT_EQ_BANDS,
     MAX_INPUT_EQ_BANDS,
     MAX_XOVER_BANDS,
@@ -88,16 +105,293 @@ from .const import (
     PATH_MATRIX_IN_MUTE,
     PATH_MATRIX_CHANNEL_GAIN,
     PATH_MATRIX_CHANNEL_MUTE,
-    # Coordinator keys
-    COORDINATOR,
-    CLIENT,
-    SCENE_MANAGER,
-    ACTIVE_SCENE_ID,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.NUMBER, Platform.SWITCH, Platform.BUTTON, Platform.SENSOR, Platform.SELECT, Platform.TEXT]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Preset service schemas
+_SAVE_PRESET_SCHEMA = vol.Schema({
+    vol.Required("name"): cv.string,
+    vol.Optional(ATTR_DEVICE_ID): cv.string,
+})
+_SCENE_ID_SCHEMA = vol.Schema({
+    vol.Required("scene_id"): cv.positive_int,
+    vol.Optional(ATTR_DEVICE_ID): cv.string,
+})
+_RENAME_PRESET_SCHEMA = vol.Schema({
+    vol.Required("scene_id"): cv.positive_int,
+    vol.Required("name"): cv.string,
+    vol.Optional(ATTR_DEVICE_ID): cv.string,
+})
+
+PLATFORMS: tuple[Platform, ...] = (Platform.NUMBER, Platform.SWITCH, Platform.BUTTON, Platform.SENSOR, Platform.SELECT, Platform.TEXT)
+
+# Poll result layout, formatted once at import instead of on every poll.
+# A spec is a tuple of (key, path, default) triples describing one dict in the
+# coordinator data; defaults fill in values that were not fetched.
+_OUT_FIELDS = (
+    ("enable", PATH_CHANNEL_ENABLE, True),
+    ("gain", PATH_CHANNEL_GAIN, 1.0),
+    ("mute", PATH_CHANNEL_MUTE, False),
+    ("polarity", PATH_CHANNEL_POLARITY, False),
+    ("delay_enable", PATH_CHANNEL_OUT_DELAY_ENABLE, False),
+    ("delay", PATH_CHANNEL_OUT_DELAY_VALUE, 0.0),
+)
+_IN_FIELDS = (
+    ("enable", PATH_INPUT_ENABLE, True),
+    ("gain", PATH_INPUT_GAIN, 1.0),
+    ("mute", PATH_INPUT_MUTE, False),
+    ("polarity", PATH_INPUT_POLARITY, False),
+    ("shading_gain", PATH_INPUT_SHADING_GAIN, 1.0),
+    ("delay_enable", PATH_INPUT_DELAY_ENABLE, False),
+    ("delay", PATH_INPUT_DELAY_VALUE, 0.0),
+)
+
+# IIR bands; gain is in dB, 0 = unity
+_OUT_IIR_FIELDS = (
+    ("enable", PATH_OUTPUT_IIR_ENABLE, False),
+    ("type", PATH_OUTPUT_IIR_TYPE, 0),
+    ("fc", PATH_OUTPUT_IIR_FC, 1000.0),
+    ("gain", PATH_OUTPUT_IIR_GAIN, 0.0),
+    ("q", PATH_OUTPUT_IIR_Q, 1.0),
+    ("slope", PATH_OUTPUT_IIR_SLOPE, 12),
+)
+_PRE_IIR_FIELDS = (
+    ("enable", PATH_PRE_OUTPUT_IIR_ENABLE, False),
+    ("type", PATH_PRE_OUTPUT_IIR_TYPE, 0),
+    ("fc", PATH_PRE_OUTPUT_IIR_FC, 1000.0),
+    ("gain", PATH_PRE_OUTPUT_IIR_GAIN, 0.0),
+    ("q", PATH_PRE_OUTPUT_IIR_Q, 1.0),
+    ("slope", PATH_PRE_OUTPUT_IIR_SLOPE, 12),
+)
+_IN_IIR_FIELDS = (
+    ("enable", PATH_INPUT_ZONE_IIR_ENABLE, False),
+    ("type", PATH_INPUT_ZONE_IIR_TYPE, 0),
+    ("fc", PATH_INPUT_ZONE_IIR_FC, 1000.0),
+    ("gain", PATH_INPUT_ZONE_IIR_GAIN, 0.0),
+    ("q", PATH_INPUT_ZONE_IIR_Q, 1.0),
+    ("slope", PATH_INPUT_ZONE_IIR_SLOPE, 12),
+)
+
+_LIMITER_FIELDS = tuple(
+    (name, (("enable", enable_path, False), ("threshold", threshold_path, 1.0)))
+    for name, enable_path, threshold_path in (
+        ("clip", PATH_LIMITER_CLIP_ENABLE, PATH_LIMITER_CLIP_THRESHOLD),
+        ("peak", PATH_LIMITER_PEAK_ENABLE, PATH_LIMITER_PEAK_THRESHOLD),
+        ("vrms", PATH_LIMITER_VRMS_ENABLE, PATH_LIMITER_VRMS_THRESHOLD),
+        ("irms", PATH_LIMITER_IRMS_ENABLE, PATH_LIMITER_IRMS_THRESHOLD),
+        ("clamp", PATH_LIMITER_CLAMP_ENABLE, PATH_LIMITER_CLAMP_THRESHOLD),
+        ("thermal", PATH_LIMITER_THERMAL_ENABLE, PATH_LIMITER_THERMAL_THRESHOLD),
+        ("truepower", PATH_LIMITER_TRUEPOWER_ENABLE, PATH_LIMITER_TRUEPOWER_THRESHOLD),
+    )
+)
+_XOVER_FIELDS = (
+    ("enable", PATH_XOVER_ENABLE, False),
+    ("fc", PATH_XOVER_FC, 1000.0),
+    ("slope", PATH_XOVER_SLOPE, 12),
+)
+_MATRIX_IN_FIELDS = (
+    ("gain", PATH_MATRIX_IN_GAIN, 1.0),
+    ("mute", PATH_MATRIX_IN_MUTE, False),
+)
+_MATRIX_ROUTE_FIELDS = (
+    ("gain", PATH_MATRIX_CHANNEL_GAIN, 1.0),
+    ("mute", PATH_MATRIX_CHANNEL_MUTE, False),
+)
+
+
+def _spec(fields: tuple, **fmt: int) -> tuple[tuple[str, str, Any], ...]:
+    """Format the path templates of a field table for one channel/band."""
+    return tuple((key, tmpl.format(**fmt), default) for key, tmpl, default in fields)
+
+
+# Indexed specs are tuples of (string key, spec) pairs (string keys for JSON compatibility)
+_OUT_SPECS = tuple(
+    (
+        str(channel),
+        (("name", PATH_CHANNEL_NAME.format(channel=channel), f"Output {channel + 1}"),)
+        + _spec(_OUT_FIELDS, channel=channel),
+    )
+    for channel in range(MAX_CHANNELS)
+)
+_IN_SPECS = tuple(
+    (str(channel), _spec(_IN_FIELDS, channel=channel)) for channel in range(MAX_CHANNELS)
+)
+_OUT_IIR_SPECS = tuple(
+    tuple((str(band), _spec(_OUT_IIR_FIELDS, channel=channel, band=band)) for band in range(8))
+    for channel in range(MAX_CHANNELS)
+)
+_PRE_IIR_SPECS = tuple(
+    tuple(
+        (str(band), _spec(_PRE_IIR_FIELDS, channel=channel, band=band))
+        for band in range(MAX_PRE_OUTPUT_EQ_BANDS)
+    )
+    for channel in range(MAX_CHANNELS)
+)
+_IN_IIR_SPECS = tuple(
+    tuple(
+        (str(band), _spec(_IN_IIR_FIELDS, channel=channel, band=band))
+        for band in range(MAX_INPUT_EQ_BANDS)
+    )
+    for channel in range(MAX_CHANNELS)
+)
+_LIMITER_SPECS = tuple(
+    (str(channel), tuple((name, _spec(fields, channel=channel)) for name, fields in _LIMITER_FIELDS))
+    for channel in range(MAX_CHANNELS)
+)
+_XOVER_SPECS = tuple(
+    (
+        str(channel),
+        tuple(
+            (str(band), _spec(_XOVER_FIELDS, channel=channel, band=band))
+            for band in range(MAX_XOVER_BANDS)
+        ),
+    )
+    for channel in range(MAX_CHANNELS)
+)
+_MATRIX_IN_SPECS = tuple(
+    (str(input_ch), _spec(_MATRIX_IN_FIELDS, input=input_ch)) for input_ch in range(MAX_CHANNELS)
+)
+_MATRIX_ROUTE_SPECS = tuple(
+    (
+        str(channel),
+        tuple(
+            (str(input_ch), _spec(_MATRIX_ROUTE_FIELDS, channel=channel, input=input_ch))
+            for input_ch in range(MAX_CHANNELS)
+        ),
+    )
+    for channel in range(MAX_CHANNELS)
+)
+_DEVICE_INFO_SPEC = (
+    ("firmware_version", PATH_FIRMWARE_VERSION, "Unknown"),
+    ("model_name", PATH_MODEL_NAME, "Bias Amplifier"),
+    ("serial_number", PATH_MODEL_SERIAL, "Unknown"),
+)
+
+# System values stored on the top level of the coordinator data, read every poll
+_SYSTEM_SPEC = (("standby", PATH_STANDBY, False),)
+_SYSTEM_PATHS = tuple(path for _, path, _ in _SYSTEM_SPEC)
+
+# Static device info, only read on the first poll and every DEVICE_INFO_REFRESH_INTERVAL
+_DEVICE_INFO_PATHS = tuple(path for _, path, _ in _DEVICE_INFO_SPEC)
+
+# Channel gain/mute change often and are fetched on every poll; the other
+# channel settings (name, enable, polarity, delay, shading) only on every
+# _SLOW_POLL_EVERY-th poll. DSP batches are appended per cycle.
+_FAST_KEYS = frozenset({"gain", "mute"})
+_FAST_PATHS = tuple(
+    path for _, spec in _OUT_SPECS + _IN_SPECS for key, path, _ in spec if key in _FAST_KEYS
+)
+_SLOW_PATHS = tuple(
+    path for _, spec in _OUT_SPECS + _IN_SPECS for key, path, _ in spec if key not in _FAST_KEYS
+)
+
+
+def _build_data_skeleton() -> tuple[dict[str, Any], dict[str, tuple[dict, str]]]:
+    """Create coordinator data filled with defaults.
+
+    Also returns an index mapping each polled path to the dict and key its
+    value is stored under, so a poll result can be routed into place with
+    one lookup per returned value.
+    """
+    path_index: dict[str, tuple[dict, str]] = {}
+
+    def node(spec: tuple) -> dict[str, Any]:
+        target: dict[str, Any] = {}
+        for key, path, default in spec:
+            target[key] = default
+            path_index[path] = (target, key)
+        return target
+
+    output_channels = {}
+    for (ch_key, spec), iir_bands, pre_iir_bands in zip(_OUT_SPECS, _OUT_IIR_SPECS, _PRE_IIR_SPECS):
+        ch_data = output_channels[ch_key] = node(spec)
+        ch_data["iir"] = {band_key: node(band_spec) for band_key, band_spec in iir_bands}
+        ch_data["pre_iir"] = {band_key: node(band_spec) for band_key, band_spec in pre_iir_bands}
+
+    input_channels = {}
+    for (ch_key, spec), iir_bands in zip(_IN_SPECS, _IN_IIR_SPECS):
+        ch_data = input_channels[ch_key] = node(spec)
+        ch_data["iir"] = {band_key: node(band_spec) for band_key, band_spec in iir_bands}
+
+    data = node(_SYSTEM_SPEC)
+    data.update({
+        "output_channels": output_channels,
+        "input_channels": input_channels,
+        "device_info": node(_DEVICE_INFO_SPEC),
+        "limiters": {
+            ch_key: {name: node(spec) for name, spec in limiter_specs}
+            for ch_key, limiter_specs in _LIMITER_SPECS
+        },
+        "crossovers": {
+            ch_key: {band_key: node(spec) for band_key, spec in band_specs}
+            for ch_key, band_specs in _XOVER_SPECS
+        },
+        "matrix": {
+            "inputs": {in_key: node(spec) for in_key, spec in _MATRIX_IN_SPECS},
+            "channels": {
+                ch_key: {"routing": {in_key: node(spec) for in_key, spec in route_specs}}
+                for ch_key, route_specs in _MATRIX_ROUTE_SPECS
+            },
+        },
+    })
+    return data, path_index
+
+
+
+def _spec_paths(indexed_specs) -> tuple[str, ...]:
+    """Flatten (key, spec) pairs into the paths of their specs."""
+    return tuple(path for _, spec in indexed_specs for _, path, _ in spec)
+
+
+# v0.4.0 - DSP parameter batches; the coordinator fetches one per poll so
+# the amplifier isn't overwhelmed (all batches complete every 10 polls)
+_DSP_BATCHES = (
+    # Batch 0-1: Output IIR EQ channels 0-1 / 2-3 (8 bands × 6 params × 2 channels = 96 paths)
+    _spec_paths(chain.from_iterable(_OUT_IIR_SPECS[0:2])),
+    _spec_paths(chain.from_iterable(_OUT_IIR_SPECS[2:4])),
+    # Batch 2-3: Pre-Output IIR EQ channels 0-1 / 2-3 (8 bands × 6 params × 2 channels = 96 paths)
+    _spec_paths(chain.from_iterable(_PRE_IIR_SPECS[0:2])),
+    _spec_paths(chain.from_iterable(_PRE_IIR_SPECS[2:4])),
+    # Batch 4-5: Input IIR EQ channels 0-1 / 2-3 (7 bands × 6 params × 2 channels = 84 paths)
+    _spec_paths(chain.from_iterable(_IN_IIR_SPECS[0:2])),
+    _spec_paths(chain.from_iterable(_IN_IIR_SPECS[2:4])),
+    # Batch 6-7: Limiters channels 0-1 / 2-3 (7 types × 2 params × 2 channels = 28 paths)
+    _spec_paths(chain.from_iterable(specs for _, specs in _LIMITER_SPECS[0:2])),
+    _spec_paths(chain.from_iterable(specs for _, specs in _LIMITER_SPECS[2:4])),
+    # Batch 8: Crossovers all channels (2 bands × 3 params × 4 channels = 24 paths)
+    _spec_paths(chain.from_iterable(specs for _, specs in _XOVER_SPECS)),
+    # Batch 9: Matrix mixer (4 input gains/mutes + 16 routing gains/mutes = 40 paths)
+    _spec_paths(_MATRIX_IN_SPECS)
+    + _spec_paths(chain.from_iterable(specs for _, specs in _MATRIX_ROUTE_SPECS)),
+)
+
+# Number of DSP batches rotated through by the coordinator
+_DSP_BATCH_COUNT = len(_DSP_BATCHES)
+
+# Slow channel settings are fetched with every n-th DSP batch (divides _DSP_BATCH_COUNT)
+_SLOW_POLL_EVERY = 5
+
+
+@dataclass(slots=True)
+class BiasEntryData:
+    """Runtime objects of a configured amplifier, kept in hass.data."""
+
+    coordinator: BiasDataUpdateCoordinator
+    client: BiasHTTPClient
+    scene_manager: SceneManager
+    scene_sync_debouncer: Debouncer
+    active_scene_id: int | None = None  # Track currently active scene
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Powersoft Bias component."""
+    # Services are domain-level, so they are registered once here rather
+    # than on every entry setup
+    await async_register_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -121,29 +415,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=scan_interval),
     )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
-
-    # Create and load scene manager
+    # Fetch initial data and load presets concurrently
     scene_manager = SceneManager(hass, entry.entry_id)
-    await scene_manager.async_load()
+    try:
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            scene_manager.async_load(),
+        )
+    except Exception:
+        # Setup is retried with a new client, so release this one's session
+        await client.disconnect()
+        raise
+
     _LOGGER.info(
         "Scene manager initialized: %d preset(s)",
         scene_manager.get_custom_scene_count()
     )
 
+    # Preset edits refresh the button/text platforms in place. A single edit
+    # is applied right away; further edits within the cooldown are coalesced
+    # into one trailing refresh
+    @callback
+    def _async_signal_scenes_updated() -> None:
+        async_dispatcher_send(hass, SIGNAL_SCENES_UPDATED.format(entry_id=entry.entry_id))
+
+    scene_sync_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=PRESET_SYNC_COOLDOWN,
+        immediate=True,
+        function=_async_signal_scenes_updated,
+    )
+
     # Store coordinator, client, scene manager, and active scene tracking
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        COORDINATOR: coordinator,
-        CLIENT: client,
-        SCENE_MANAGER: scene_manager,
-        ACTIVE_SCENE_ID: None,  # Track currently active scene
-    }
-
-    # Register services (only once for the domain)
-    if not hass.services.has_service(DOMAIN, "save_preset"):
-        await async_register_services(hass)
+    hass.data[DOMAIN][entry.entry_id] = BiasEntryData(
+        coordinator=coordinator,
+        client=client,
+        scene_manager=scene_manager,
+        scene_sync_debouncer=scene_sync_debouncer,
+    )
 
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -156,20 +467,49 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         # Clean up coordinator and client
-        data = hass.data[DOMAIN].pop(entry.entry_id)
-        client: BiasHTTPClient = data[CLIENT]
-        await client.disconnect()
+        data: BiasEntryData = hass.data[DOMAIN].pop(entry.entry_id)
+        data.scene_sync_debouncer.async_cancel()
+        await data.scene_manager.async_unload()
+        await data.client.disconnect()
 
     return unload_ok
 
 
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register integration services."""
-    import voluptuous as vol
-    from homeassistant.helpers import config_validation as cv
-
     _LOGGER.info("Registering Powersoft Bias services")
 
+    def _get_entry_data(call) -> BiasEntryData:
+        """Return the entry data targeted by a service call.
+
+        Uses the optional device_id, which is required once more than one
+        amplifier is loaded so a preset never lands on an arbitrary amp.
+        """
+        entries = hass.data.get(DOMAIN)
+        if not entries:
+            raise ServiceValidationError("No Powersoft Bias amplifier is loaded")
+
+        device_id = call.data.get(ATTR_DEVICE_ID)
+        if device_id is None:
+            if len(entries) > 1:
+                raise ServiceValidationError(
+                    "device_id is required when more than one Powersoft Bias "
+                    "amplifier is loaded"
+                )
+            (data,) = entries.values()
+            return data
+
+        # Devices are registered with (DOMAIN, entry_id) as identifier
+        device = dr.async_get(hass).async_get(device_id)
+        if device is not None:
+            for domain, entry_id in device.identifiers:
+                if domain == DOMAIN and entry_id in entries:
+                    return entries[entry_id]
+
+        raise ServiceValidationError(
+            f"Device {device_id} is not a loaded Powersoft Bias amplifier"
+        )
+
     def _normalize_bool(value):
         """Convert various boolean representations to actual bool."""
         if isinstance(value, bool):
@@ -217,156 +557,129 @@ async def async_register_services(hass: HomeAssistant) -> None:
 
         return normalized
 
-    async def handle_save_preset(call):
+    def _service_handler(service: str):
+        """Wrap a preset service handler.
+
+        Resolves the targeted entry, logs failures and refreshes the preset
+        entities (debounced) after a successful call.
+        """
+        def decorator(func):
+            @wraps(func)
+            async def wrapper(call) -> None:
+                data = _get_entry_data(call)
+                try:
+                    await func(call, data)
+                except Exception as err:
+                    _LOGGER.error("Service %s failed: %s", service, err)
+                    raise
+
+                # Refresh preset entities in place (debounced)
+                await data.scene_sync_debouncer.async_call()
+
+            return wrapper
+        return decorator
+
+    @_service_handler("save_preset")
+    async def handle_save_preset(call, data: BiasEntryData) -> None:
         """Handle save_preset service call."""
         name = call.data["name"]
         _LOGGER.info("Service call: save_preset with name='%s'", name)
+        coordinator = data.coordinator
+        scene_manager = data.scene_manager
 
-        # Get the first available entry (services are domain-level, not per-entry)
-        entry_id = next(iter(hass.data[DOMAIN].keys()))
-        data = hass.data[DOMAIN][entry_id]
-        coordinator: BiasDataUpdateCoordinator = data[COORDINATOR]
-        scene_manager: SceneManager = data[SCENE_MANAGER]
-
-        try:
-            # Use coordinator data instead of querying amplifier
-            # This avoids timeout issues with 729 path requests
-            raw_config = coordinator.data.copy() if coordinator.data else {}
-
-            # Normalize data types for preset validation
-            config = _normalize_preset_data(raw_config)
-
-            # Save as new scene
-            scene_id = await scene_manager.async_create_scene(name, config)
+        # Use coordinator data instead of querying amplifier
+        # This avoids timeout issues with 729 path requests
+        raw_config = coordinator.snapshot()
 
-            _LOGGER.info("Successfully created preset '%s' (ID: %d)", name, scene_id)
+        # Normalize data types for preset validation
+        config = _normalize_preset_data(raw_config)
 
-            # Reload integration to refresh button entities
-            await hass.config_entries.async_reload(entry_id)
+        # Save as new scene
+        scene_id = await scene_manager.async_create_scene(name, config)
 
-        except Exception as err:
-            _LOGGER.error("Failed to save preset '%s': %s", name, err)
-            raise
+        _LOGGER.info("Successfully created preset '%s' (ID: %d)", name, scene_id)
 
-    async def handle_update_preset(call):
+    @_service_handler("update_preset")
+    async def handle_update_preset(call, data: BiasEntryData) -> None:
         """Handle update_preset service call."""
         scene_id = call.data["scene_id"]
         _LOGGER.info("Service call: update_preset with scene_id=%d", scene_id)
+        coordinator = data.coordinator
+        scene_manager = data.scene_manager
 
-        # Get the first available entry
-        entry_id = next(iter(hass.data[DOMAIN].keys()))
-        data = hass.data[DOMAIN][entry_id]
-        coordinator: BiasDataUpdateCoordinator = data[COORDINATOR]
-        scene_manager: SceneManager = data[SCENE_MANAGER]
-
-        try:
-            # Use coordinator data instead of querying amplifier
-            # This avoids timeout issues with 729 path requests
-            raw_config = coordinator.data.copy() if coordinator.data else {}
-
-            # Normalize data types for preset validation
-            config = _normalize_preset_data(raw_config)
+        # Use coordinator data instead of querying amplifier
+        # This avoids timeout issues with 729 path requests
+        raw_config = coordinator.snapshot()
 
-            # Update existing scene
-            await scene_manager.async_update_scene(scene_id, config)
+        # Normalize data types for preset validation
+        config = _normalize_preset_data(raw_config)
 
-            _LOGGER.info("Successfully updated preset ID %d", scene_id)
+        # Update existing scene
+        await scene_manager.async_update_scene(scene_id, config)
 
-            # Reload integration to refresh button entities
-            await hass.config_entries.async_reload(entry_id)
+        _LOGGER.info("Successfully updated preset ID %d", scene_id)
 
-        except Exception as err:
-            _LOGGER.error("Failed to update preset %d: %s", scene_id, err)
-            raise
-
-    async def handle_delete_preset(call):
+    @_service_handler("delete_preset")
+    async def handle_delete_preset(call, data: BiasEntryData) -> None:
         """Handle delete_preset service call."""
         scene_id = call.data["scene_id"]
         _LOGGER.info("Service call: delete_preset with scene_id=%d", scene_id)
+        scene_manager = data.scene_manager
 
-        # Get the first available entry
-        entry_id = next(iter(hass.data[DOMAIN].keys()))
-        data = hass.data[DOMAIN][entry_id]
-        scene_manager: SceneManager = data[SCENE_MANAGER]
-
-        try:
-            # Delete the scene
-            await scene_manager.async_delete_scene(scene_id)
+        # Delete the scene
+        await scene_manager.async_delete_scene(scene_id)
 
-            _LOGGER.info("Successfully deleted preset ID %d", scene_id)
-
-            # Reload integration to refresh button entities
-            await hass.config_entries.async_reload(entry_id)
-
-        except Exception as err:
-            _LOGGER.error("Failed to delete preset %d: %s", scene_id, err)
-            raise
+        _LOGGER.info("Successfully deleted preset ID %d", scene_id)
 
-    async def handle_rename_preset(call):
+    @_service_handler("rename_preset")
+    async def handle_rename_preset(call, data: BiasEntryData) -> None:
         """Handle rename_preset service call."""
         scene_id = call.data["scene_id"]
         new_name = call.data["name"]
         _LOGGER.info("Service call: rename_preset with scene_id=%d, name='%s'", scene_id, new_name)
+        scene_manager = data.scene_manager
 
-        # Get the first available entry
-        entry_id = next(iter(hass.data[DOMAIN].keys()))
-        data = hass.data[DOMAIN][entry_id]
-        scene_manager: SceneManager = data[SCENE_MANAGER]
+        # Rename the scene
+        await scene_manager.async_rename_scene(scene_id, new_name)
 
-        try:
-            # Rename the scene
-            await scene_manager.async_rename_scene(scene_id, new_name)
-
-            _LOGGER.info("Successfully renamed preset ID %d", scene_id)
-
-            # Reload integration to refresh button names
-            await hass.config_entries.async_reload(entry_id)
-
-        except Exception as err:
-            _LOGGER.error("Failed to rename preset %d: %s", scene_id, err)
-            raise
+        _LOGGER.info("Successfully renamed preset ID %d", scene_id)
 
     # Register services
     hass.services.async_register(
         DOMAIN,
         "save_preset",
         handle_save_preset,
-        schema=vol.Schema({
-            vol.Required("name"): cv.string,
-        }),
+        schema=_SAVE_PRESET_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         "update_preset",
         handle_update_preset,
-        schema=vol.Schema({
-            vol.Required("scene_id"): cv.positive_int,
-        }),
+        schema=_SCENE_ID_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         "delete_preset",
         handle_delete_preset,
-        schema=vol.Schema({
-            vol.Required("scene_id"): cv.positive_int,
-        }),
+        schema=_SCENE_ID_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         "rename_preset",
         handle_rename_preset,
-        schema=vol.Schema({
-            vol.Required("scene_id"): cv.positive_int,
-            vol.Required("name"): cv.string,
-        }),
+        schema=_RENAME_PRESET_SCHEMA,
     )
 
 
 class BiasDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Bias amplifier data."""
+    """Class to manage fetching Bias amplifier data.
+
+    The data dict is built once and updated in place; treat it as read-only
+    and use snapshot() to keep a copy.
+    """
 
     def __init__(
         self,
@@ -383,464 +696,168 @@ class BiasDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.client = client
         self._batch_index = 0  # Track which DSP parameter batch to fetch
+        self._data_cache: dict[str, Any] | None = None  # Returned (and updated) on every poll
+        self._path_index: dict[str, tuple[dict, str]] = {}  # Path -> (dict, key) in data
+        self._device_info_read_at: float | None = None  # Monotonic time of last device info read
+
+        # Paths read on each poll of the batch rotation: channel gain/mute,
+        # slow channel settings (every _SLOW_POLL_EVERY-th poll), the DSP
+        # batch and the system paths. Built once instead of on every poll.
+        self._poll_paths = tuple(
+            _FAST_PATHS
+            + (_SLOW_PATHS if batch_index % _SLOW_POLL_EVERY == 0 else ())
+            + _DSP_BATCHES[batch_index]
+            + _SYSTEM_PATHS
+            for batch_index in range(_DSP_BATCH_COUNT)
+        )
+
+        # Idle backoff: poll slower while nothing on the amplifier changes
+        self._base_interval = update_interval
+        self._max_interval = max(update_interval, timedelta(seconds=MAX_IDLE_SCAN_INTERVAL))
+        self._stable_cycles = 0
+        self._last_values: dict[str, Any] = {}
+
+    async def async_reset_backoff(self) -> None:
+        """Return to the base poll interval (e.g. after a write)."""
+        self._stable_cycles = 0
+        if self.update_interval != self._base_interval:
+            self.update_interval = self._base_interval
+            # The pending poll may be minutes away; refreshing now also
+            # schedules the next one at the base interval
+            await self.async_request_refresh()
+
+    async def async_write_value(self, path: str, value: Any) -> bool:
+        """Write a value to the amplifier and resume fast polling."""
+        result = await self.client.write_value(path, value)
+        await self.async_reset_backoff()
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a deep copy of the current data.
+
+        The data is updated in place on every poll, so callers that keep it
+        (e.g. presets) must store a snapshot rather than a reference.
+        """
+        return copy.deepcopy(self.data) if self.data else {}
+
+    @callback
+    def async_update_local(self, value: Any, *keys: str) -> None:
+        """Store a written value in the coordinator data and notify listeners.
+
+        keys is the nested location of the value, e.g.
+        ("output_channels", "0", "gain"). Missing levels are created.
+        """
+        if not self.data:
+            return
 
-    def _get_dsp_batch_paths(self, batch_index: int) -> list[str]:
-        """Get a batch of DSP parameter paths to reduce API load.
+        node = self.data
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+        self.async_update_listeners()
 
-        Returns one of 10 batches per call to avoid overwhelming the amplifier.
-        Batches split by channel pairs to keep each batch ~50-96 paths.
+    def _update_backoff(self, values: dict[str, Any]) -> None:
+        """Adjust the poll interval based on whether any read value changed.
+
+        Every full DSP rotation without a change doubles the interval, up to
+        MAX_IDLE_SCAN_INTERVAL. Any change drops back to the base interval.
         """
-        paths = []
-
-        if batch_index == 0:
-            # Batch 0: Output IIR EQ channels 0-1 (8 bands × 6 params × 2 channels = 96 paths)
-            for channel in range(2):
-                for band in range(8):
-                    paths.append(PATH_OUTPUT_IIR_ENABLE.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_TYPE.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_FC.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_GAIN.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_Q.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_SLOPE.format(channel=channel, band=band))
-
-        elif batch_index == 1:
-            # Batch 1: Output IIR EQ channels 2-3 (8 bands × 6 params × 2 channels = 96 paths)
-            for channel in range(2, 4):
-                for band in range(8):
-                    paths.append(PATH_OUTPUT_IIR_ENABLE.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_TYPE.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_FC.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_GAIN.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_Q.format(channel=channel, band=band))
-                    paths.append(PATH_OUTPUT_IIR_SLOPE.format(channel=channel, band=band))
-
-        elif batch_index == 2:
-            # Batch 2: Pre-Output IIR EQ channels 0-1 (8 bands × 6 params × 2 channels = 96 paths)
-            for channel in range(2):
-                for band in range(8):
-                    paths.append(PATH_PRE_OUTPUT_IIR_ENABLE.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_TYPE.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_FC.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_GAIN.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_Q.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_SLOPE.format(channel=channel, band=band))
-
-        elif batch_index == 3:
-            # Batch 3: Pre-Output IIR EQ channels 2-3 (8 bands × 6 params × 2 channels = 96 paths)
-            for channel in range(2, 4):
-                for band in range(8):
-                    paths.append(PATH_PRE_OUTPUT_IIR_ENABLE.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_TYPE.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_FC.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_GAIN.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_Q.format(channel=channel, band=band))
-                    paths.append(PATH_PRE_OUTPUT_IIR_SLOPE.format(channel=channel, band=band))
-
-        elif batch_index == 4:
-            # Batch 4: Input IIR EQ channels 0-1 (7 bands × 6 params × 2 channels = 84 paths)
-            for channel in range(2):
-                for band in range(7):
-                    paths.append(PATH_INPUT_ZONE_IIR_ENABLE.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_TYPE.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_FC.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_GAIN.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_Q.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_SLOPE.format(channel=channel, band=band))
-
-        elif batch_index == 5:
-            # Batch 5: Input IIR EQ channels 2-3 (7 bands × 6 params × 2 channels = 84 paths)
-            for channel in range(2, 4):
-                for band in range(7):
-                    paths.append(PATH_INPUT_ZONE_IIR_ENABLE.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_TYPE.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_FC.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_GAIN.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_Q.format(channel=channel, band=band))
-                    paths.append(PATH_INPUT_ZONE_IIR_SLOPE.format(channel=channel, band=band))
-
-        elif batch_index == 6:
-            # Batch 6: Limiters channels 0-1 (7 types × 2 params × 2 channels = 28 paths)
-            for channel in range(2):
-                paths.append(PATH_LIMITER_CLIP_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_CLIP_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_PEAK_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_PEAK_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_VRMS_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_VRMS_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_IRMS_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_IRMS_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_CLAMP_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_CLAMP_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_THERMAL_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_THERMAL_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_TRUEPOWER_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_TRUEPOWER_THRESHOLD.format(channel=channel))
-
-        elif batch_index == 7:
-            # Batch 7: Limiters channels 2-3 (7 types × 2 params × 2 channels = 28 paths)
-            for channel in range(2, 4):
-                paths.append(PATH_LIMITER_CLIP_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_CLIP_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_PEAK_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_PEAK_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_VRMS_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_VRMS_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_IRMS_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_IRMS_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_CLAMP_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_CLAMP_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_THERMAL_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_THERMAL_THRESHOLD.format(channel=channel))
-                paths.append(PATH_LIMITER_TRUEPOWER_ENABLE.format(channel=channel))
-                paths.append(PATH_LIMITER_TRUEPOWER_THRESHOLD.format(channel=channel))
-
-        elif batch_index == 8:
-            # Batch 8: Crossovers all channels (3 bands × 3 params × 4 channels = 36 paths)
-            for channel in range(MAX_CHANNELS):
-                for band in range(MAX_XOVER_BANDS):
-                    paths.append(PATH_XOVER_ENABLE.format(channel=channel, band=band))
-                    paths.append(PATH_XOVER_FC.format(channel=channel, band=band))
-                    paths.append(PATH_XOVER_SLOPE.format(channel=channel, band=band))
-
-        elif batch_index == 9:
-            # Batch 9: Matrix mixer (4 input gains/mutes + 16 routing gains/mutes = 40 paths)
-            for input_ch in range(MAX_CHANNELS):
-                paths.append(PATH_MATRIX_IN_GAIN.format(input=input_ch))
-                paths.append(PATH_MATRIX_IN_MUTE.format(input=input_ch))
-
-            for channel in range(MAX_CHANNELS):
-                for input_ch in range(MAX_CHANNELS):
-                    paths.append(PATH_MATRIX_CHANNEL_GAIN.format(channel=channel, input=input_ch))
-                    paths.append(PATH_MATRIX_CHANNEL_MUTE.format(channel=channel, input=input_ch))
-
-        return paths
+        last_values = self._last_values
+        changed = any(
+            path in last_values and last_values[path] != value
+            for path, value in values.items()
+        )
+        last_values.update(values)
+
+        if changed:
+            self._stable_cycles = 0
+            self.update_interval = self._base_interval
+        elif self.update_interval < self._max_interval:
+            self._stable_cycles += 1
+            self.update_interval = min(
+                self._base_interval * 2 ** (self._stable_cycles // _DSP_BATCH_COUNT),
+                self._max_interval,
+            )
 
     async def _async_update_data(self) -> dict:
         """Fetch data from API endpoint."""
         try:
-            # Build list of paths to read
-            paths = []
-
-            # Output channels - comprehensive parameters
-            for channel in range(MAX_CHANNELS):
-                paths.append(PATH_CHANNEL_NAME.format(channel=channel))
-                paths.append(PATH_CHANNEL_ENABLE.format(channel=channel))
-                paths.append(PATH_CHANNEL_GAIN.format(channel=channel))
-                paths.append(PATH_CHANNEL_MUTE.format(channel=channel))
-                paths.append(PATH_CHANNEL_POLARITY.format(channel=channel))
-                paths.append(PATH_CHANNEL_OUT_DELAY_ENABLE.format(channel=channel))
-                paths.append(PATH_CHANNEL_OUT_DELAY_VALUE.format(channel=channel))
-
-            # Input channels - comprehensive parameters
-            for channel in range(MAX_CHANNELS):
-                paths.append(PATH_INPUT_ENABLE.format(channel=channel))
-                paths.append(PATH_INPUT_GAIN.format(channel=channel))
-                paths.append(PATH_INPUT_MUTE.format(channel=channel))
-                paths.append(PATH_INPUT_POLARITY.format(channel=channel))
-                paths.append(PATH_INPUT_SHADING_GAIN.format(channel=channel))
-                paths.append(PATH_INPUT_DELAY_ENABLE.format(channel=channel))
-                paths.append(PATH_INPUT_DELAY_VALUE.format(channel=channel))
+            # While the amplifier is in standby nothing but the standby flag
+            # changes, so poll just that until it wakes up
+            data = self._data_cache
+            if data is not None and data["standby"]:
+                values = await self.client.read_values([PATH_STANDBY])
+                # No idle backoff in standby, so waking the amplifier from
+                # its front panel is picked up within one base interval
+                self._stable_cycles = 0
+                self.update_interval = self._base_interval
+                if values.get(PATH_STANDBY, True):
+                    return data
+                _LOGGER.debug("Amplifier left standby, resuming full polling")
 
             # v0.4.0 - DSP Parameters (Batched polling with smaller batches)
             # Fetch one batch of ~28-96 DSP parameters per update cycle
             # All 10 batches rotate through, completing every 10 update cycles
-            dsp_batch = self._get_dsp_batch_paths(self._batch_index)
-            paths.extend(dsp_batch)
+            # The full path tuple for each batch is built once in __init__
+            batch_index = self._batch_index
+            paths = self._poll_paths[batch_index]
             _LOGGER.debug(
-                "Fetching DSP parameter batch %d (%d paths)",
-                self._batch_index,
-                len(dsp_batch)
+                "Fetching DSP parameter batch %d (%d paths in total)",
+                batch_index,
+                len(paths)
             )
 
             # Rotate to next batch (0-9)
-            self._batch_index = (self._batch_index + 1) % 10
+            self._batch_index = (batch_index + 1) % _DSP_BATCH_COUNT
 
-            # System parameters
-            paths.append(PATH_STANDBY)
-            paths.append(PATH_FIRMWARE_VERSION)
-            paths.append(PATH_MODEL_NAME)
-            paths.append(PATH_MODEL_SERIAL)
+            # Device info (firmware, model, serial) is static, so re-read it rarely
+            now = time.monotonic()
+            read_device_info = (
+                self._device_info_read_at is None
+                or now - self._device_info_read_at >= DEVICE_INFO_REFRESH_INTERVAL
+            )
+            if read_device_info:
+                paths += _DEVICE_INFO_PATHS
 
             # Read all values
             values = await self.client.read_values(paths)
 
-            # Start with existing data if available, otherwise create new structure
-            # This preserves values from previous batches that aren't in the current batch
-            if self.data:
-                data = self.data.copy()
-            else:
-                data = {
-                    "output_channels": {},
-                    "input_channels": {},
-                    "device_info": {},
-                    "standby": None,
-                    "limiters": {},
-                    "crossovers": {},
-                    "matrix": {"inputs": {}, "channels": {}},
-                }
-
-            # Parse output channels (use string keys for JSON compatibility)
-            for channel in range(MAX_CHANNELS):
-                ch_key = str(channel)
-
-                # Initialize channel if it doesn't exist
-                if ch_key not in data["output_channels"]:
-                    data["output_channels"][ch_key] = {
-                        "name": f"Output {channel + 1}",
-                        "enable": True,
-                        "gain": 1.0,
-                        "mute": False,
-                        "polarity": False,
-                        "delay_enable": False,
-                        "delay": 0.0,
-                        "iir": {},
-                        "pre_iir": {},
-                    }
-
-                # Update only values that were fetched in this batch
-                path = PATH_CHANNEL_NAME.format(channel=channel)
-                if path in values:
-                    data["output_channels"][ch_key]["name"] = values[path]
-                path = PATH_CHANNEL_ENABLE.format(channel=channel)
-                if path in values:
-                    data["output_channels"][ch_key]["enable"] = values[path]
-                path = PATH_CHANNEL_GAIN.format(channel=channel)
-                if path in values:
-                    data["output_channels"][ch_key]["gain"] = values[path]
-                path = PATH_CHANNEL_MUTE.format(channel=channel)
-                if path in values:
-                    data["output_channels"][ch_key]["mute"] = values[path]
-                path = PATH_CHANNEL_POLARITY.format(channel=channel)
-                if path in values:
-                    data["output_channels"][ch_key]["polarity"] = values[path]
-                path = PATH_CHANNEL_OUT_DELAY_ENABLE.format(channel=channel)
-                if path in values:
-                    data["output_channels"][ch_key]["delay_enable"] = values[path]
-                path = PATH_CHANNEL_OUT_DELAY_VALUE.format(channel=channel)
-                if path in values:
-                    data["output_channels"][ch_key]["delay"] = values[path]
-
-                # v0.4.0 - Output IIR EQ (8 bands)
-                # Only update bands that were fetched in this batch
-                for band in range(8):
-                    band_key = str(band)
-
-                    # Initialize band if it doesn't exist
-                    if band_key not in data["output_channels"][ch_key]["iir"]:
-                        data["output_channels"][ch_key]["iir"][band_key] = {
-                            "enable": False,
-                            "type": 0,
-                            "fc": 1000.0,
-                            "gain": 0.0,  # EQ gain in dB, 0 = unity
-                            "q": 1.0,
-                            "slope": 12,
-                        }
-
-                    # Update only if fetched
-                    path = PATH_OUTPUT_IIR_ENABLE.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["iir"][band_key]["enable"] = values[path]
-                    path = PATH_OUTPUT_IIR_TYPE.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["iir"][band_key]["type"] = values[path]
-                    path = PATH_OUTPUT_IIR_FC.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["iir"][band_key]["fc"] = values[path]
-                    path = PATH_OUTPUT_IIR_GAIN.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["iir"][band_key]["gain"] = values[path]
-                    path = PATH_OUTPUT_IIR_Q.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["iir"][band_key]["q"] = values[path]
-                    path = PATH_OUTPUT_IIR_SLOPE.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["iir"][band_key]["slope"] = values[path]
-
-                # v0.4.0 - Pre-Output (Speaker) IIR EQ (8 bands)
-                # Only update bands that were fetched in this batch
-                for band in range(8):
-                    band_key = str(band)
-
-                    # Initialize band if it doesn't exist
-                    if band_key not in data["output_channels"][ch_key]["pre_iir"]:
-                        data["output_channels"][ch_key]["pre_iir"][band_key] = {
-                            "enable": False,
-                            "type": 0,
-                            "fc": 1000.0,
-                            "gain": 0.0,  # Speaker EQ gain in dB, 0 = unity
-                            "q": 1.0,
-                            "slope": 12,
-                        }
-
-                    # Update only if fetched
-                    path = PATH_PRE_OUTPUT_IIR_ENABLE.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["pre_iir"][band_key]["enable"] = values[path]
-                    path = PATH_PRE_OUTPUT_IIR_TYPE.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["pre_iir"][band_key]["type"] = values[path]
-                    path = PATH_PRE_OUTPUT_IIR_FC.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["pre_iir"][band_key]["fc"] = values[path]
-                    path = PATH_PRE_OUTPUT_IIR_GAIN.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["pre_iir"][band_key]["gain"] = values[path]
-                    path = PATH_PRE_OUTPUT_IIR_Q.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["pre_iir"][band_key]["q"] = values[path]
-                    path = PATH_PRE_OUTPUT_IIR_SLOPE.format(channel=channel, band=band)
-                    if path in values:
-                        data["output_channels"][ch_key]["pre_iir"][band_key]["slope"] = values[path]
-
-            # Parse input channels (use string keys for JSON compatibility)
-            for channel in range(MAX_CHANNELS):
-                ch_key = str(channel)
-
-                # Initialize channel if it doesn't exist
-                if ch_key not in data["input_channels"]:
-                    data["input_channels"][ch_key] = {
-                        "enable": True,
-                        "gain": 1.0,
-                        "mute": False,
-                        "polarity": False,
-                        "shading_gain": 1.0,
-                        "delay_enable": False,
-                        "delay": 0.0,
-                        "iir": {},
-                    }
-
-                # Update only values that were fetched
-                path = PATH_INPUT_ENABLE.format(channel=channel)
-                if path in values:
-                    data["input_channels"][ch_key]["enable"] = values[path]
-                path = PATH_INPUT_GAIN.format(channel=channel)
-                if path in values:
-                    data["input_channels"][ch_key]["gain"] = values[path]
-                path = PATH_INPUT_MUTE.format(channel=channel)
-                if path in values:
-                    data["input_channels"][ch_key]["mute"] = values[path]
-                path = PATH_INPUT_POLARITY.format(channel=channel)
-                if path in values:
-                    data["input_channels"][ch_key]["polarity"] = values[path]
-                path = PATH_INPUT_SHADING_GAIN.format(channel=channel)
-                if path in values:
-                    data["input_channels"][ch_key]["shading_gain"] = values[path]
-                path = PATH_INPUT_DELAY_ENABLE.format(channel=channel)
-                if path in values:
-                    data["input_channels"][ch_key]["delay_enable"] = values[path]
-                path = PATH_INPUT_DELAY_VALUE.format(channel=channel)
-                if path in values:
-                    data["input_channels"][ch_key]["delay"] = values[path]
-
-                # v0.4.0 - Input IIR EQ (7 bands)
-                # Only update bands that were fetched in this batch
-                for band in range(7):
-                    band_key = str(band)
-
-                    # Initialize band if it doesn't exist
-                    if band_key not in data["input_channels"][ch_key]["iir"]:
-                        data["input_channels"][ch_key]["iir"][band_key] = {
-                            "enable": False,
-                            "type": 0,
-                            "fc": 1000.0,
-                            "gain": 0.0,  # Input EQ gain in dB, 0 = unity
-                            "q": 1.0,
-                            "slope": 12,
-                        }
-
-                    # Update only if fetched
-                    path = PATH_INPUT_ZONE_IIR_ENABLE.format(channel=channel, band=band)
-                    if path in values:
-                        data["input_channels"][ch_key]["iir"][band_key]["enable"] = values[path]
-                    path = PATH_INPUT_ZONE_IIR_TYPE.format(channel=channel, band=band)
-                    if path in values:
-                        data["input_channels"][ch_key]["iir"][band_key]["type"] = values[path]
-                    path = PATH_INPUT_ZONE_IIR_FC.format(channel=channel, band=band)
-                    if path in values:
-                        data["input_channels"][ch_key]["iir"][band_key]["fc"] = values[path]
-                    path = PATH_INPUT_ZONE_IIR_GAIN.format(channel=channel, band=band)
-                    if path in values:
-                        data["input_channels"][ch_key]["iir"][band_key]["gain"] = values[path]
-                    path = PATH_INPUT_ZONE_IIR_Q.format(channel=channel, band=band)
-                    if path in values:
-                        data["input_channels"][ch_key]["iir"][band_key]["q"] = values[path]
-                    path = PATH_INPUT_ZONE_IIR_SLOPE.format(channel=channel, band=band)
-                    if path in values:
-                        data["input_channels"][ch_key]["iir"][band_key]["slope"] = values[path]
-
-            # v0.4.0 - Parse limiters
-            for channel in range(MAX_CHANNELS):
-                ch_key = str(channel)
-                data["limiters"][ch_key] = {
-                    "clip": {
-                        "enable": values.get(PATH_LIMITER_CLIP_ENABLE.format(channel=channel), False),
-                        "threshold": values.get(PATH_LIMITER_CLIP_THRESHOLD.format(channel=channel), 1.0),
-                    },
-                    "peak": {
-                        "enable": values.get(PATH_LIMITER_PEAK_ENABLE.format(channel=channel), False),
-                        "threshold": values.get(PATH_LIMITER_PEAK_THRESHOLD.format(channel=channel), 1.0),
-                    },
-                    "vrms": {
-                        "enable": values.get(PATH_LIMITER_VRMS_ENABLE.format(channel=channel), False),
-                        "threshold": values.get(PATH_LIMITER_VRMS_THRESHOLD.format(channel=channel), 1.0),
-                    },
-                    "irms": {
-                        "enable": values.get(PATH_LIMITER_IRMS_ENABLE.format(channel=channel), False),
-                        "threshold": values.get(PATH_LIMITER_IRMS_THRESHOLD.format(channel=channel), 1.0),
-                    },
-                    "clamp": {
-                        "enable": values.get(PATH_LIMITER_CLAMP_ENABLE.format(channel=channel), False),
-                        "threshold": values.get(PATH_LIMITER_CLAMP_THRESHOLD.format(channel=channel), 1.0),
-                    },
-                    "thermal": {
-                        "enable": values.get(PATH_LIMITER_THERMAL_ENABLE.format(channel=channel), False),
-                        "threshold": values.get(PATH_LIMITER_THERMAL_THRESHOLD.format(channel=channel), 1.0),
-                    },
-                    "truepower": {
-                        "enable": values.get(PATH_LIMITER_TRUEPOWER_ENABLE.format(channel=channel), False),
-                        "threshold": values.get(PATH_LIMITER_TRUEPOWER_THRESHOLD.format(channel=channel), 1.0),
-                    },
-                }
-
-            # v0.4.0 - Parse crossovers
-            for channel in range(MAX_CHANNELS):
-                ch_key = str(channel)
-                data["crossovers"][ch_key] = {}
-                for band in range(MAX_XOVER_BANDS):
-                    band_key = str(band)
-                    data["crossovers"][ch_key][band_key] = {
-                        "enable": values.get(PATH_XOVER_ENABLE.format(channel=channel, band=band), False),
-                        "fc": values.get(PATH_XOVER_FC.format(channel=channel, band=band), 1000.0),
-                        "slope": values.get(PATH_XOVER_SLOPE.format(channel=channel, band=band), 12),
-                    }
-
-            # v0.4.0 - Parse matrix mixer
-            for input_ch in range(MAX_CHANNELS):
-                in_key = str(input_ch)
-                data["matrix"]["inputs"][in_key] = {
-                    "gain": values.get(PATH_MATRIX_IN_GAIN.format(input=input_ch), 1.0),
-                    "mute": values.get(PATH_MATRIX_IN_MUTE.format(input=input_ch), False),
-                }
-
-            for channel in range(MAX_CHANNELS):
-                ch_key = str(channel)
-                data["matrix"]["channels"][ch_key] = {"routing": {}}
-                for input_ch in range(MAX_CHANNELS):
-                    in_key = str(input_ch)
-                    data["matrix"]["channels"][ch_key]["routing"][in_key] = {
-                        "gain": values.get(PATH_MATRIX_CHANNEL_GAIN.format(channel=channel, input=input_ch), 1.0),
-                        "mute": values.get(PATH_MATRIX_CHANNEL_MUTE.format(channel=channel, input=input_ch), False),
-                    }
-
-            # Parse system/device info
-            data["standby"] = values.get(PATH_STANDBY, False)
-            data["device_info"] = {
-                "firmware_version": values.get(PATH_FIRMWARE_VERSION, "Unknown"),
-                "model_name": values.get(PATH_MODEL_NAME, "Bias Amplifier"),
-                "serial_number": values.get(PATH_MODEL_SERIAL, "Unknown"),
-            }
-
-            return data
+            # On the first refresh, also fetch the other DSP batches so
+            # entities start with real values rather than defaults. Each batch
+            # is its own request, so no request is larger than a regular poll.
+            # These are best effort: a failed batch keeps its defaults until
+            # its turn in the rotation instead of failing the whole setup
+            if self._data_cache is None:
+                for other_index, batch in enumerate(_DSP_BATCHES):
+                    if other_index == batch_index:
+                        continue
+                    try:
+                        values.update(await self.client.read_values(batch))
+                    except Exception as err:
+                        _LOGGER.warning(
+                            "Failed to fetch DSP parameter batch %d, will retry on rotation: %s",
+                            other_index,
+                            err,
+                        )
+
+            self._update_backoff(values)
+            if read_device_info:
+                self._device_info_read_at = now
+
+            # The data structure is built once and updated in place, which
+            # preserves values from previous batches that aren't in the current batch
+            if self._data_cache is None:
+                self._data_cache, self._path_index = _build_data_skeleton()
+
+            # Route each fetched value into its slot
+            path_index = self._path_index
+            for path, value in values.items():
+                slot = path_index.get(path)
+                if slot is not None:
+                    target, key = slot
+                    target[key] = value
+
+            return self._data_cache
 
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
@@ -7,11 +7,31 @@ This module provides an async client for communicating with these amplifiers.
 Protocol: POST /am with JSON payload
 """
 import asyncio
+from functools import lru_cache
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import aiohttp
 import async_timeout
 
+try:
+    # orjson ships with Home Assistant; fall back to json when used standalone
+    import orjson
+
+    _json_bytes = orjson.dumps
+    _json_loads = orjson.loads
+
+    def _preset_key(preset: Dict[Any, Any]) -> bytes:
+        # Older presets may have int channel keys
+        return orjson.dumps(preset, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+
+    def _json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+    _preset_key = _json_bytes
+
 _LOGGER = logging.getLogger(__name__)
 
 # Data type constants
@@ -20,6 +40,14 @@ TYPE_FLOAT = 20
 TYPE_INT = 30
 TYPE_BOOL = 40
 
+# Response field holding the value of each data type
+_TYPE_VALUE_KEYS = {
+    TYPE_STRING: "stringValue",
+    TYPE_FLOAT: "floatValue",
+    TYPE_INT: "intValue",
+    TYPE_BOOL: "boolValue",
+}
+
 # Action type constants
 ACTION_READ = "READ"
 ACTION_WRITE = "WRITE"
@@ -27,20 +55,314 @@ ACTION_WRITE = "WRITE"
 # Response result codes
 RESULT_SUCCESS = 10
 
+# Sent with every /am request; bodies are pre-encoded bytes, which aiohttp
+# would otherwise label application/octet-stream
+_HEADERS = {"Content-Type": "application/json"}
+
+# Connection pool settings (an amplifier serves a handful of sockets at most)
+CONNECTION_LIMIT_PER_HOST = 4
+KEEPALIVE_TIMEOUT = 75  # seconds
+DNS_CACHE_TTL = 300  # seconds
+
+# Session shared by all clients, and the number of clients using it
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_users = 0
+
+
+_VALUES_MARKER = "@values@"
+
+
+def _request_frame(client_id: str, action_type: str) -> Tuple[bytes, bytes]:
+    """Serialize the invariant /am request envelope around its values list."""
+    body = _json_bytes({
+        "clientId": client_id,
+        "payload": {
+            "type": "ACTION",
+            "action": {"type": action_type, "values": _VALUES_MARKER},
+        },
+    })
+    prefix, suffix = body.split(f'"{_VALUES_MARKER}"'.encode())
+    return prefix, suffix
+
+
+def _response_values(data: Any) -> List[Dict[str, Any]]:
+    """Return the per-path value objects of an /am response (empty if malformed)."""
+    try:
+        return data["payload"]["action"]["values"]
+    except (KeyError, TypeError):
+        return []
+
+
+def _parse_values_checked(value_objs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Parse read results one by one, logging the entries that are skipped."""
+    result = {}
+    for value_obj in value_objs:
+        try:
+            path = value_obj["id"]
+            result_code = value_obj.get("result")
+            if result_code != RESULT_SUCCESS:
+                _LOGGER.warning("Failed to read %s: result=%s", path, result_code)
+                continue
+
+            data_obj = value_obj["data"]
+            data_type = data_obj["type"]
+            value_key = _TYPE_VALUE_KEYS.get(data_type)
+            if value_key is None:
+                _LOGGER.warning("Unknown data type %s for %s", data_type, path)
+                continue
+            result[path] = data_obj.get(value_key)
+        except (KeyError, TypeError, AttributeError):
+            _LOGGER.warning("Skipping malformed value in response: %s", value_obj)
+    return result
+
+
+_TRUE_STRINGS = frozenset(('true', '1', 'yes', 'on'))
+
+
+def _to_bool(value: Any, default: bool = False) -> bool:
+    """Convert a read value to bool (handles int 0/1, strings, etc.)."""
+    # bool first: it is also an int
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return value != 0
+    if isinstance(value, str):
+        return value.lower() in _TRUE_STRINGS
+    return default
+
+
+_OUTPUT_CHANNEL = "/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}"
+_INPUT_CHANNEL = "/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}"
+_MATRIX = "/Device/Audio/Presets/Live/InputProcess/Matrix"
+_STANDBY_PATH = "/Device/Audio/Presets/Live/Generals/Standby/Value"
+
+# IIR band fields: (key, path suffix, cast, default)
+_IIR_BAND_FIELDS = (
+    ("enable", "/Enable", _to_bool, False),
+    ("type", "/Type/Value", int, 0),
+    ("fc", "/Fc/Value", float, 1000.0),
+    ("gain", "/Gain/Value", float, 1.0),
+    ("q", "/Q/Value", float, 1.0),
+    ("slope", "/Slope/Value", int, 12),
+)
+
+# Limiter preset keys and their path segment
+_LIMITERS = (
+    ("clip", "ClipLimiter"),
+    ("peak", "PeakLimiter"),
+    ("vrms", "VRMSLimiter"),
+    ("irms", "IRMSLimiter"),
+    ("clamp", "ClampLimiter"),
+    ("thermal", "ThermalLimiter"),
+    ("truepower", "TruePowerLimiter"),
+)
+
+
+def _build_capture_schema() -> Tuple[Tuple[str, Tuple[str, ...], str, Any, Any, Any], ...]:
+    """Return (path, parent keys, key, cast, value type, default) per captured value.
+
+    Entries are in preset order, so the structure built from them has the
+    same key order as saved presets. A cast of None keeps the raw value;
+    otherwise values already of the default's exact type skip the cast.
+    """
+    schema = []
+
+    def add(parents, key, path, cast, default):
+        value_type = type(default) if cast is not None else None
+        schema.append((path, parents, key, cast, value_type, default))
+
+    # Output channels, including their EQ (use string keys for JSON compatibility)
+    for channel in range(4):
+        base = _OUTPUT_CHANNEL.format(channel=channel)
+        out = ("output_channels", str(channel))
+        add(out, "name", f"{base}/Name", None, f"Output {channel + 1}")
+        add(out, "enable", f"{base}/Enable", _to_bool, True)
+        add(out, "gain", f"{base}/Gain/Value", float, 1.0)
+        add(out, "mute", f"{base}/Mute/Value", _to_bool, False)
+        add(out, "polarity", f"{base}/OutPolarity/Value", _to_bool, False)
+        add(out, "delay_enable", f"{base}/OutDelay/Enable", _to_bool, False)
+        add(out, "delay", f"{base}/OutDelay/Value", float, 0.0)
+
+        # v0.4.0 - Output IIR EQ (8 bands) and Pre-Output IIR EQ (8 bands)
+        for eq_key, segment in (("iir", "IIR"), ("pre_iir", "PreIIR")):
+            for band in range(8):
+                band_base = f"{base}/{segment}/Bands/Band-{band}"
+                band_parents = out + (eq_key, str(band))
+                for key, suffix, cast, default in _IIR_BAND_FIELDS:
+                    add(band_parents, key, band_base + suffix, cast, default)
+
+    # Input channels, including their EQ
+    for channel in range(4):
+        base = _INPUT_CHANNEL.format(channel=channel)
+        inp = ("input_channels", str(channel))
+        add(inp, "enable", f"{base}/Enable/Value", _to_bool, True)
+        add(inp, "gain", f"{base}/Gain/Value", float, 1.0)
+        add(inp, "mute", f"{base}/Mute/Value", _to_bool, False)
+        add(inp, "polarity", f"{base}/InPolarity/Value", _to_bool, False)
+        add(inp, "shading_gain", f"{base}/ShadingGain/Value", float, 1.0)
+        add(inp, "delay_enable", f"{base}/InDelay/Enable/Value", _to_bool, False)
+        add(inp, "delay", f"{base}/InDelay/Value", float, 0.0)
+
+        # v0.4.0 - Input IIR EQ (7 bands)
+        for band in range(7):
+            band_base = f"{base}/ZoneBlock/IIR/Bands/Band-{band}"
+            band_parents = inp + ("iir", str(band))
+            for key, suffix, cast, default in _IIR_BAND_FIELDS:
+                add(band_parents, key, band_base + suffix, cast, default)
+
+    # v0.4.0 - Limiters (7 types)
+    for channel in range(4):
+        base = _OUTPUT_CHANNEL.format(channel=channel)
+        for name, segment in _LIMITERS:
+            lim = ("limiters", str(channel), name)
+            lim_base = f"{base}/Limiters/{segment}"
+            add(lim, "enable", f"{lim_base}/Enable", _to_bool, False)
+            add(lim, "threshold", f"{lim_base}/Threshold/Value", float, 1.0)
+
+    # v0.4.0 - Crossover (2 bands)
+    for channel in range(4):
+        base = _OUTPUT_CHANNEL.format(channel=channel)
+        for band in range(2):
+            xover = ("crossovers", str(channel), str(band))
+            band_base = f"{base}/Xover/Bands/Band-{band}"
+            add(xover, "enable", f"{band_base}/Enable", _to_bool, False)
+            add(xover, "fc", f"{band_base}/Fc/Value", float, 1000.0)
+            add(xover, "slope", f"{band_base}/Slope/Value", int, 12)
+
+    # v0.4.0 - Matrix mixer (4×4)
+    for input_ch in range(4):
+        matrix_in = ("matrix", "inputs", str(input_ch))
+        input_base = f"{_MATRIX}/Inputs/Input-{input_ch}"
+        add(matrix_in, "gain", f"{input_base}/Gain/Value", float, 1.0)
+        add(matrix_in, "mute", f"{input_base}/Mute/Value", _to_bool, False)
+    for channel in range(4):
+        for input_ch in range(4):
+            route = ("matrix", "channels", str(channel), "routing", str(input_ch))
+            route_base = f"{_MATRIX}/Channels/Channel-{channel}/Routing/Input-{input_ch}"
+            add(route, "gain", f"{route_base}/Gain/Value", float, 1.0)
+            add(route, "mute", f"{route_base}/Mute/Value", _to_bool, False)
+
+    # System state
+    add((), "standby", _STANDBY_PATH, _to_bool, False)
+
+    return tuple(schema)
+
+
+# Built once at import; the captured paths never change between calls
+_CAPTURE_SCHEMA = _build_capture_schema()
+_CAPTURE_PATHS = tuple(entry[0] for entry in _CAPTURE_SCHEMA)
+_CAPTURE_DEFAULTS = {entry[0]: entry[5] for entry in _CAPTURE_SCHEMA}
+
+
+def _pack_bool(value: Any) -> Dict[str, Any]:
+    return {"type": TYPE_BOOL, "boolValue": value}
+
+
+def _pack_float(value: Any) -> Dict[str, Any]:
+    return {"type": TYPE_FLOAT, "floatValue": float(value)}
+
+
+def _pack_int(value: Any) -> Dict[str, Any]:
+    return {"type": TYPE_INT, "intValue": int(value)}
+
+
+def _pack_string(value: Any) -> Dict[str, Any]:
+    return {"type": TYPE_STRING, "stringValue": value}
+
+
+# apply_scene() writes every captured value except the channel names:
+# (path, parent keys, key, pack) with pack building the write's data object
+_PACKERS = {_to_bool: _pack_bool, float: _pack_float, int: _pack_int}
+_APPLY_SCHEMA = tuple(
+    (path, parents, key, _PACKERS[cast])
+    for path, parents, key, cast, _value_type, _default in _CAPTURE_SCHEMA
+    if cast is not None
+)
+
+
+# Marks a field absent from the preset (None may be a stored value)
+_MISSING = object()
+
+
+def _preset_child(node: Dict[Any, Any], key: str) -> Any:
+    """Return node[key], also accepting int channel keys from older presets."""
+    child = node.get(key)
+    if child is None and key.isdigit():
+        child = node.get(int(key))
+    return child
+
+
+# Values per apply_scene() write request
+APPLY_BATCH_SIZE = 100
+
+# Recently applied presets whose serialized write requests are kept for
+# re-applying
+APPLY_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=APPLY_CACHE_SIZE)
+def _build_write_batches(preset_key: bytes) -> Tuple[Tuple[int, bytes], ...]:
+    """Return (value count, serialized values) per write request of a preset.
+
+    The preset is given in its serialized form. Sections, channels and fields
+    missing from it are left out, so they stay untouched on the amplifier.
+    Presets are mostly re-applied unchanged, hence the cache keyed by their
+    serialized form: re-applying skips both building and encoding the writes.
+    """
+    scene_config = _json_loads(preset_key)
+
+    # Schema entries are grouped by parent, so each parent node is only
+    # looked up once
+    write_values = []
+    last_parents = None
+    node = None
+    for path, parents, key, pack in _APPLY_SCHEMA:
+        if parents != last_parents:
+            last_parents = parents
+            node = scene_config
+            for parent in parents:
+                node = _preset_child(node, parent)
+                if node is None:
+                    break
+        if node is not None:
+            value = node.get(key, _MISSING)
+            if value is not _MISSING:
+                write_values.append({"id": path, "data": pack(value), "single": True})
+
+    # Split write_values into batches of 100 to avoid overwhelming amplifier
+    return tuple(
+        (len(batch), _json_bytes(batch))
+        for batch in (
+            write_values[i:i + APPLY_BATCH_SIZE]
+            for i in range(0, len(write_values), APPLY_BATCH_SIZE)
+        )
+    )
+
 
 class BiasHTTPClient:
     """
     Async HTTP client for Powersoft Bias amplifiers.
 
     These amplifiers use a JSON REST API over HTTP on port 80.
+
+    Create one instance per amplifier and keep it for the lifetime of the
+    config entry: connect() is idempotent and every request reuses the shared
+    keep-alive session, so no per-poll setup or handshake is paid. Call
+    disconnect() once on unload to release the session.
     """
 
+    __slots__ = (
+        "host", "port", "timeout", "client_id", "_frames", "base_url", "_session",
+        "_external_session",
+    )
+
     def __init__(
         self,
         host: str,
         port: int = 80,
         timeout: float = 5.0,
-        client_id: str = "home-assistant"
+        client_id: str = "home-assistant",
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize the Bias HTTP client.
@@ -50,33 +372,77 @@ class BiasHTTPClient:
             port: HTTP port (default 80)
             timeout: Request timeout in seconds
             client_id: Client identifier for API requests
+            session: Caller-owned session to use instead of the shared one;
+                it is never closed by the client
         """
         self.host = host
         self.port = port
         self.timeout = timeout
         self.client_id = client_id
+        # Request envelopes per action type, serialized once
+        self._frames = {
+            action_type: _request_frame(client_id, action_type)
+            for action_type in (ACTION_READ, ACTION_WRITE)
+        }
         self.base_url = f"http://{host}:{port}"
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._external_session = session is not None
+
+    def _request_body(self, action_type: str, values: List[Dict[str, Any]]) -> bytes:
+        """Return the /am request body for a list of value objects."""
+        prefix, suffix = self._frames[action_type]
+        return prefix + _json_bytes(values) + suffix
 
     async def connect(self) -> None:
-        """Create HTTP session."""
+        """Attach to the shared pooled keep-alive HTTP session.
+
+        All clients (every configured amplifier, plus config flows validating
+        one) share one session; its pool keeps up to CONNECTION_LIMIT_PER_HOST
+        connections alive per amplifier.
+        """
+        global _shared_session, _shared_session_users
+
         if self._session is None:
-            self._session = aiohttp.ClientSession()
-            _LOGGER.debug("Created HTTP session for %s", self.host)
+            if _shared_session is None or _shared_session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=0,
+                    limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                )
+                _shared_session = aiohttp.ClientSession(connector=connector)
+                _shared_session_users = 0
+                _LOGGER.debug("Created shared HTTP session")
+            _shared_session_users += 1
+            self._session = _shared_session
 
     async def disconnect(self) -> None:
-        """Close HTTP session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
-            _LOGGER.debug("Closed HTTP session for %s", self.host)
+        """Release the HTTP session; the last client to release it closes it."""
+        global _shared_session, _shared_session_users
+
+        if self._external_session:
+            # Owned by the caller
+            return
 
-    async def read_values(self, paths: List[str]) -> Dict[str, Any]:
+        session, self._session = self._session, None
+        if session is None:
+            return
+
+        if session is _shared_session:
+            _shared_session_users -= 1
+            if _shared_session_users > 0:
+                return
+            _shared_session = None
+
+        await session.close()
+        _LOGGER.debug("Closed shared HTTP session")
+
+    async def read_values(self, paths: Sequence[str]) -> Dict[str, Any]:
         """
         Read values from the amplifier.
 
         Args:
-            paths: List of parameter paths to read
+            paths: Sequence (list or tuple) of parameter paths to read
                   e.g., ["/Device/Config/Hardware/Model/Serial"]
 
         Returns:
@@ -89,49 +455,34 @@ class BiasHTTPClient:
         if self._session is None:
             await self.connect()
 
-        payload = {
-            "clientId": self.client_id,
-            "payload": {
-                "type": "ACTION",
-                "action": {
-                    "type": ACTION_READ,
-                    "values": [{"id": path, "single": True} for path in paths]
-                }
-            }
-        }
+        body = self._request_body(ACTION_READ, [{"id": path, "single": True} for path in paths])
 
         try:
             async with async_timeout.timeout(self.timeout):
                 async with self._session.post(
                     f"{self.base_url}/am",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
+                    data=body,
+                    headers=_HEADERS,
                 ) as response:
                     response.raise_for_status()
-                    data = await response.json()
+                    data = _json_loads(await response.read())
 
             # Parse response
-            result = {}
-            action = data.get("payload", {}).get("action", {})
-            for value_obj in action.get("values", []):
-                path = value_obj.get("id")
-                if value_obj.get("result") != RESULT_SUCCESS:
-                    _LOGGER.warning("Failed to read %s: result=%s", path, value_obj.get("result"))
-                    continue
-
-                data_obj = value_obj.get("data", {})
-                data_type = data_obj.get("type")
-
-                if data_type == TYPE_STRING:
-                    result[path] = data_obj.get("stringValue")
-                elif data_type == TYPE_FLOAT:
-                    result[path] = data_obj.get("floatValue")
-                elif data_type == TYPE_INT:
-                    result[path] = data_obj.get("intValue")
-                elif data_type == TYPE_BOOL:
-                    result[path] = data_obj.get("boolValue")
-                else:
-                    _LOGGER.warning("Unknown data type %s for %s", data_type, path)
+            value_objs = _response_values(data)
+            try:
+                result = {
+                    value_obj["id"]: data_obj.get(_TYPE_VALUE_KEYS[data_obj["type"]])
+                    for value_obj in value_objs
+                    if value_obj.get("result") == RESULT_SUCCESS
+                    and (data_obj := value_obj["data"])["type"] in _TYPE_VALUE_KEYS
+                }
+            except (KeyError, TypeError, AttributeError):
+                result = None
+
+            # Only parse entry by entry when a value was skipped or malformed,
+            # so a bad entry is dropped and logged rather than failing the read
+            if result is None or len(result) < len(value_objs):
+                result = _parse_values_checked(value_objs)
 
             return result
 
@@ -173,51 +524,39 @@ class BiasHTTPClient:
         if self._session is None:
             await self.connect()
 
-        # Determine data type and build data object
+        # Determine data type and build data object (bool first: it is also
+        # an int; subclasses such as IntEnum are accepted)
         if isinstance(value, bool):
-            data_obj = {"type": TYPE_BOOL, "boolValue": value}
+            data_obj = _pack_bool(value)
         elif isinstance(value, int):
             # Send integers as TYPE_INT (for filter types, slopes, etc.)
-            data_obj = {"type": TYPE_INT, "intValue": int(value)}
+            data_obj = _pack_int(value)
         elif isinstance(value, float):
-            data_obj = {"type": TYPE_FLOAT, "floatValue": float(value)}
+            data_obj = _pack_float(value)
         elif isinstance(value, str):
-            data_obj = {"type": TYPE_STRING, "stringValue": value}
+            data_obj = _pack_string(value)
         else:
             raise ValueError(f"Unsupported value type: {type(value)}")
 
-        payload = {
-            "clientId": self.client_id,
-            "payload": {
-                "type": "ACTION",
-                "action": {
-                    "type": ACTION_WRITE,
-                    "values": [{
-                        "id": path,
-                        "data": data_obj,
-                        "single": True
-                    }]
-                }
-            }
-        }
+        body = self._request_body(ACTION_WRITE, [{"id": path, "data": data_obj, "single": True}])
 
         try:
             async with async_timeout.timeout(self.timeout):
                 async with self._session.post(
                     f"{self.base_url}/am",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
+                    data=body,
+                    headers=_HEADERS,
                 ) as response:
                     response.raise_for_status()
-                    data = await response.json()
-
-            # Check if write was successful
-            action = data.get("payload", {}).get("action", {})
-            for value_obj in action.get("values", []):
-                if value_obj.get("id") == path:
-                    return value_obj.get("result") == RESULT_SUCCESS
+                    data = _json_loads(await response.read())
 
-            return False
+            # Check if write was successful; a single-value write is answered
+            # with just that value
+            try:
+                value_obj = data["payload"]["action"]["values"][0]
+            except (KeyError, IndexError, TypeError):
+                return False
+            return value_obj.get("id") == path and value_obj.get("result") == RESULT_SUCCESS
 
         except aiohttp.ClientError as err:
             _LOGGER.error("HTTP request failed to %s: %s", self.host, err)
@@ -263,250 +602,56 @@ class BiasHTTPClient:
         """
         _LOGGER.info("Capturing current amplifier state (v0.4.0 comprehensive)...")
 
-        # Build list of paths to read
-        paths = []
-
-        # Output channels: All parameters
-        for channel in range(4):
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Name")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Gain/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Mute/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/OutPolarity/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/OutDelay/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/OutDelay/Value")
-
-            # v0.4.0 - Output IIR EQ (8 bands)
-            for band in range(8):
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Enable")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Type/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Fc/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Gain/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Q/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Slope/Value")
-
-            # v0.4.0 - Pre-Output IIR EQ (8 bands)
-            for band in range(8):
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Enable")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Type/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Fc/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Gain/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Q/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Slope/Value")
-
-            # v0.4.0 - Limiters (7 types)
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClipLimiter/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClipLimiter/Threshold/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/PeakLimiter/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/PeakLimiter/Threshold/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/VRMSLimiter/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/VRMSLimiter/Threshold/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/IRMSLimiter/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/IRMSLimiter/Threshold/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClampLimiter/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClampLimiter/Threshold/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ThermalLimiter/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ThermalLimiter/Threshold/Value")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/TruePowerLimiter/Enable")
-            paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/TruePowerLimiter/Threshold/Value")
-
-            # v0.4.0 - Crossover (2 bands)
-            for band in range(2):
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Xover/Bands/Band-{band}/Enable")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Xover/Bands/Band-{band}/Fc/Value")
-                paths.append(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Xover/Bands/Band-{band}/Slope/Value")
-
-        # Input channels: All parameters
-        for channel in range(4):
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/Enable/Value")
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/Gain/Value")
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/Mute/Value")
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/InPolarity/Value")
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ShadingGain/Value")
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/InDelay/Enable/Value")
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/InDelay/Value")
-
-            # v0.4.0 - Input IIR EQ (7 bands)
-            for band in range(7):
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Enable")
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Type/Value")
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Fc/Value")
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Gain/Value")
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Q/Value")
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Slope/Value")
-
-        # v0.4.0 - Matrix mixer (4×4)
-        for input_ch in range(4):
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Inputs/Input-{input_ch}/Gain/Value")
-            paths.append(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Inputs/Input-{input_ch}/Mute/Value")
-        for channel in range(4):
-            for input_ch in range(4):
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Channels/Channel-{channel}/Routing/Input-{input_ch}/Gain/Value")
-                paths.append(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Channels/Channel-{channel}/Routing/Input-{input_ch}/Mute/Value")
-
-        # System state
-        paths.append("/Device/Audio/Presets/Live/Generals/Standby/Value")
-
-        # Read all values
-        values = await self.read_values(paths)
-
-        # Helper to convert to boolean (handles int 0/1, strings, etc.)
-        def to_bool(value, default=False):
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, int):
-                return bool(value)
-            if isinstance(value, str):
-                return value.lower() in ('true', '1', 'yes', 'on')
-            return default
-
-        # Structure output channels data (use string keys for JSON compatibility)
-        output_channels = {}
-        for channel in range(4):
-            ch_key = str(channel)
-            output_channels[ch_key] = {
-                "name": values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Name", f"Output {channel + 1}"),
-                "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Enable", True)),
-                "gain": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Gain/Value", 1.0)),
-                "mute": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Mute/Value", False)),
-                "polarity": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/OutPolarity/Value", False)),
-                "delay_enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/OutDelay/Enable", False)),
-                "delay": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/OutDelay/Value", 0.0)),
-                "iir": {},
-                "pre_iir": {},
-            }
-
-            # v0.4.0 - Output IIR EQ (8 bands)
-            for band in range(8):
-                band_key = str(band)
-                output_channels[ch_key]["iir"][band_key] = {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Enable", False)),
-                    "type": int(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Type/Value", 0)),
-                    "fc": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Fc/Value", 1000.0)),
-                    "gain": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Gain/Value", 1.0)),
-                    "q": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Q/Value", 1.0)),
-                    "slope": int(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/IIR/Bands/Band-{band}/Slope/Value", 12)),
-                }
-
-            # v0.4.0 - Pre-Output IIR EQ (8 bands)
-            for band in range(8):
-                band_key = str(band)
-                output_channels[ch_key]["pre_iir"][band_key] = {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Enable", False)),
-                    "type": int(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Type/Value", 0)),
-                    "fc": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Fc/Value", 1000.0)),
-                    "gain": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Gain/Value", 1.0)),
-                    "q": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Q/Value", 1.0)),
-                    "slope": int(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/PreIIR/Bands/Band-{band}/Slope/Value", 12)),
-                }
-
-        # Structure input channels data (use string keys for JSON compatibility)
-        input_channels = {}
-        for channel in range(4):
-            ch_key = str(channel)
-            input_channels[ch_key] = {
-                "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/Enable/Value", True)),
-                "gain": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/Gain/Value", 1.0)),
-                "mute": to_bool(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/Mute/Value", False)),
-                "polarity": to_bool(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/InPolarity/Value", False)),
-                "shading_gain": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ShadingGain/Value", 1.0)),
-                "delay_enable": to_bool(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/InDelay/Enable/Value", False)),
-                "delay": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/InDelay/Value", 0.0)),
-                "iir": {},
-            }
-
-            # v0.4.0 - Input IIR EQ (7 bands)
-            for band in range(7):
-                band_key = str(band)
-                input_channels[ch_key]["iir"][band_key] = {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Enable", False)),
-                    "type": int(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Type/Value", 0)),
-                    "fc": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Fc/Value", 1000.0)),
-                    "gain": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Gain/Value", 1.0)),
-                    "q": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Q/Value", 1.0)),
-                    "slope": int(values.get(f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{channel}/ZoneBlock/IIR/Bands/Band-{band}/Slope/Value", 12)),
-                }
-
-        # v0.4.0 - Structure limiters data
-        limiters = {}
-        for channel in range(4):
-            ch_key = str(channel)
-            limiters[ch_key] = {
-                "clip": {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClipLimiter/Enable", False)),
-                    "threshold": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClipLimiter/Threshold/Value", 1.0)),
-                },
-                "peak": {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/PeakLimiter/Enable", False)),
-                    "threshold": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/PeakLimiter/Threshold/Value", 1.0)),
-                },
-                "vrms": {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/VRMSLimiter/Enable", False)),
-                    "threshold": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/VRMSLimiter/Threshold/Value", 1.0)),
-                },
-                "irms": {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/IRMSLimiter/Enable", False)),
-                    "threshold": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/IRMSLimiter/Threshold/Value", 1.0)),
-                },
-                "clamp": {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClampLimiter/Enable", False)),
-                    "threshold": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ClampLimiter/Threshold/Value", 1.0)),
-                },
-                "thermal": {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ThermalLimiter/Enable", False)),
-                    "threshold": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/ThermalLimiter/Threshold/Value", 1.0)),
-                },
-                "truepower": {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/TruePowerLimiter/Enable", False)),
-                    "threshold": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Limiters/TruePowerLimiter/Threshold/Value", 1.0)),
-                },
-            }
-
-        # v0.4.0 - Structure crossovers data
-        crossovers = {}
-        for channel in range(4):
-            ch_key = str(channel)
-            crossovers[ch_key] = {}
-            for band in range(2):
-                band_key = str(band)
-                crossovers[ch_key][band_key] = {
-                    "enable": to_bool(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Xover/Bands/Band-{band}/Enable", False)),
-                    "fc": float(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Xover/Bands/Band-{band}/Fc/Value", 1000.0)),
-                    "slope": int(values.get(f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{channel}/Xover/Bands/Band-{band}/Slope/Value", 12)),
-                }
-
-        # v0.4.0 - Structure matrix mixer data
-        matrix = {"inputs": {}, "channels": {}}
-        for input_ch in range(4):
-            in_key = str(input_ch)
-            matrix["inputs"][in_key] = {
-                "gain": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Inputs/Input-{input_ch}/Gain/Value", 1.0)),
-                "mute": to_bool(values.get(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Inputs/Input-{input_ch}/Mute/Value", False)),
-            }
-
-        for channel in range(4):
-            ch_key = str(channel)
-            matrix["channels"][ch_key] = {"routing": {}}
-            for input_ch in range(4):
-                in_key = str(input_ch)
-                matrix["channels"][ch_key]["routing"][in_key] = {
-                    "gain": float(values.get(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Channels/Channel-{channel}/Routing/Input-{input_ch}/Gain/Value", 1.0)),
-                    "mute": to_bool(values.get(f"/Device/Audio/Presets/Live/InputProcess/Matrix/Channels/Channel-{channel}/Routing/Input-{input_ch}/Mute/Value", False)),
-                }
-
-        # Build comprehensive preset configuration
-        preset_config = {
-            "output_channels": output_channels,
-            "input_channels": input_channels,
-            "limiters": limiters,
-            "crossovers": crossovers,
-            "matrix": matrix,
-            "standby": to_bool(values.get("/Device/Audio/Presets/Live/Generals/Standby/Value", False)),
-        }
+        # Read all values; values the amp did not return keep their default
+        values: Dict[str, Any] = _CAPTURE_DEFAULTS.copy()
+        values.update(await self.read_values(_CAPTURE_PATHS))
+
+        # Structure the values into a preset configuration
+        preset_config: Dict[str, Any] = {}
+        for path, parents, key, cast, value_type, _default in _CAPTURE_SCHEMA:
+            target = preset_config
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            value = values[path]
+            # The amp normally returns the exact type already; only convert
+            # the odd int-for-float or string value
+            target[key] = value if type(value) is value_type or cast is None else cast(value)
 
         _LOGGER.info("Captured state: v0.4.0 comprehensive (channels, EQ, limiters, crossovers, matrix)")
         return preset_config
 
+    async def _post_writes(
+        self, limit: asyncio.Semaphore, count: int, values: bytes
+    ) -> List[str]:
+        """Send one serialized batch of writes; return the paths that failed."""
+        prefix, suffix = self._frames[ACTION_WRITE]
+        body = prefix + values + suffix
+
+        # Wait for a free slot before starting the timeout, so queued
+        # batches don't time out while the earlier ones are in flight
+        async with limit:
+            _LOGGER.debug("Applying preset batch (%d values)", count)
+            async with async_timeout.timeout(self.timeout):
+                async with self._session.post(
+                    f"{self.base_url}/am",
+                    data=body,
+                    headers=_HEADERS,
+                ) as response:
+                    response.raise_for_status()
+                    data = _json_loads(await response.read())
+
+        failed_writes = []
+        for value_obj in _response_values(data):
+            if value_obj.get("result") != RESULT_SUCCESS:
+                path = value_obj.get("id")
+                result = value_obj.get("result")
+                # Don't fail on standby errors (may not be writeable)
+                if path != _STANDBY_PATH:
+                    failed_writes.append(f"{path} (result={result})")
+                else:
+                    _LOGGER.warning("Standby write not successful (may not be supported): %s", path)
+        return failed_writes
+
     async def apply_scene(self, scene_config: Dict[str, Any]) -> None:
         """
         Apply a complete preset configuration.
@@ -543,564 +688,64 @@ class BiasHTTPClient:
         if not isinstance(output_channels, dict) or len(output_channels) != 4:
             raise ValueError("Scene must contain 4 output channels (0-3)")
 
+        for ch_idx in range(4):
+            ch_config = _preset_child(output_channels, str(ch_idx))
+            if ch_config is None:
+                raise ValueError(f"Missing output channel {ch_idx} in preset")
+            if "gain" in ch_config and not 0.0 <= ch_config["gain"] <= 10.0:
+                raise ValueError(f"Output channel {ch_idx} gain must be between 0.0 and 10.0")
+
+        # Note: Standby path may not be writeable on all models
+        # We'll try to write it but won't fail if it doesn't work
+        if "standby" in scene_config and not isinstance(scene_config["standby"], bool):
+            raise ValueError("Standby must be boolean")
+
         _LOGGER.info("Applying comprehensive preset to amplifier...")
 
-        # Build write values array
-        write_values = []
+        # Build the serialized write batches (cached per preset content)
+        batches = _build_write_batches(_preset_key(scene_config))
 
-        # =================================================================
-        # Apply output channel settings
-        # =================================================================
-        for ch_idx in range(4):
-            ch_key = str(ch_idx)  # JSON always uses string keys
-            if ch_key not in output_channels and ch_idx not in output_channels:
-                raise ValueError(f"Missing output channel {ch_idx} in preset")
+        if not batches:
+            _LOGGER.debug("Preset has no values to apply")
+            return
 
-            ch_config = output_channels.get(ch_key, output_channels.get(ch_idx))
-
-            # Enable
-            if "enable" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Enable",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["enable"]},
-                    "single": True
-                })
-
-            # Gain
-            if "gain" in ch_config:
-                gain = ch_config["gain"]
-                if not 0.0 <= gain <= 10.0:
-                    raise ValueError(f"Output channel {ch_idx} gain must be between 0.0 and 10.0")
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Gain/Value",
-                    "data": {"type": TYPE_FLOAT, "floatValue": float(gain)},
-                    "single": True
-                })
-
-            # Mute
-            if "mute" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Mute/Value",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["mute"]},
-                    "single": True
-                })
-
-            # Polarity
-            if "polarity" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/OutPolarity/Value",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["polarity"]},
-                    "single": True
-                })
-
-            # Delay enable
-            if "delay_enable" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/OutDelay/Enable",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["delay_enable"]},
-                    "single": True
-                })
-
-            # Delay value
-            if "delay" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/OutDelay/Value",
-                    "data": {"type": TYPE_FLOAT, "floatValue": float(ch_config["delay"])},
-                    "single": True
-                })
-
-        # =================================================================
-        # Apply input channel settings (if present in preset)
-        # =================================================================
-        input_channels = scene_config.get("input_channels", {})
-        for ch_idx in range(4):
-            ch_key = str(ch_idx)
-            if ch_key not in input_channels and ch_idx not in input_channels:
-                continue  # Input channels are optional in preset
-
-            ch_config = input_channels.get(ch_key, input_channels.get(ch_idx))
-
-            # Enable
-            if "enable" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/Enable/Value",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["enable"]},
-                    "single": True
-                })
-
-            # Gain
-            if "gain" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/Gain/Value",
-                    "data": {"type": TYPE_FLOAT, "floatValue": float(ch_config["gain"])},
-                    "single": True
-                })
-
-            # Mute
-            if "mute" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/Mute/Value",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["mute"]},
-                    "single": True
-                })
-
-            # Polarity
-            if "polarity" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/InPolarity/Value",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["polarity"]},
-                    "single": True
-                })
-
-            # Shading gain
-            if "shading_gain" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/ShadingGain/Value",
-                    "data": {"type": TYPE_FLOAT, "floatValue": float(ch_config["shading_gain"])},
-                    "single": True
-                })
-
-            # Delay enable
-            if "delay_enable" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/InDelay/Enable/Value",
-                    "data": {"type": TYPE_BOOL, "boolValue": ch_config["delay_enable"]},
-                    "single": True
-                })
-
-            # Delay value
-            if "delay" in ch_config:
-                write_values.append({
-                    "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/InDelay/Value",
-                    "data": {"type": TYPE_FLOAT, "floatValue": float(ch_config["delay"])},
-                    "single": True
-                })
-
-            # v0.4.0 - Input IIR EQ parameters (if present)
-            if "iir" in ch_config:
-                for band_idx in range(7):
-                    band_key = str(band_idx)
-                    if band_key in ch_config["iir"]:
-                        band_config = ch_config["iir"][band_key]
-
-                        if "enable" in band_config:
-                            write_values.append({
-                                "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/ZoneBlock/IIR/Bands/Band-{band_idx}/Enable",
-                                "data": {"type": TYPE_BOOL, "boolValue": band_config["enable"]},
-                                "single": True
-                            })
-                        if "type" in band_config:
-                            write_values.append({
-                                "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/ZoneBlock/IIR/Bands/Band-{band_idx}/Type/Value",
-                                "data": {"type": TYPE_INT, "intValue": int(band_config["type"])},
-                                "single": True
-                            })
-                        if "fc" in band_config:
-                            write_values.append({
-                                "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/ZoneBlock/IIR/Bands/Band-{band_idx}/Fc/Value",
-                                "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["fc"])},
-                                "single": True
-                            })
-                        if "gain" in band_config:
-                            write_values.append({
-                                "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/ZoneBlock/IIR/Bands/Band-{band_idx}/Gain/Value",
-                                "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["gain"])},
-                                "single": True
-                            })
-                        if "q" in band_config:
-                            write_values.append({
-                                "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/ZoneBlock/IIR/Bands/Band-{band_idx}/Q/Value",
-                                "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["q"])},
-                                "single": True
-                            })
-                        if "slope" in band_config:
-                            write_values.append({
-                                "id": f"/Device/Audio/Presets/Live/InputProcess/Channels/Channel-{ch_idx}/ZoneBlock/IIR/Bands/Band-{band_idx}/Slope/Value",
-                                "data": {"type": TYPE_INT, "intValue": int(band_config["slope"])},
-                                "single": True
-                            })
-
-        # =================================================================
-        # v0.4.0 - Apply output channel EQ parameters (if present)
-        # =================================================================
-        if "output_channels" in scene_config:
-            for ch_idx in range(4):
-                ch_key = str(ch_idx)
-                if ch_key not in scene_config["output_channels"]:
-                    continue
-
-                ch_config = scene_config["output_channels"][ch_key]
-
-                # Output IIR EQ (8 bands)
-                if "iir" in ch_config:
-                    for band_idx in range(8):
-                        band_key = str(band_idx)
-                        if band_key in ch_config["iir"]:
-                            band_config = ch_config["iir"][band_key]
-
-                            if "enable" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/IIR/Bands/Band-{band_idx}/Enable",
-                                    "data": {"type": TYPE_BOOL, "boolValue": band_config["enable"]},
-                                    "single": True
-                                })
-                            if "type" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/IIR/Bands/Band-{band_idx}/Type/Value",
-                                    "data": {"type": TYPE_INT, "intValue": int(band_config["type"])},
-                                    "single": True
-                                })
-                            if "fc" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/IIR/Bands/Band-{band_idx}/Fc/Value",
-                                    "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["fc"])},
-                                    "single": True
-                                })
-                            if "gain" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/IIR/Bands/Band-{band_idx}/Gain/Value",
-                                    "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["gain"])},
-                                    "single": True
-                                })
-                            if "q" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/IIR/Bands/Band-{band_idx}/Q/Value",
-                                    "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["q"])},
-                                    "single": True
-                                })
-                            if "slope" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/IIR/Bands/Band-{band_idx}/Slope/Value",
-                                    "data": {"type": TYPE_INT, "intValue": int(band_config["slope"])},
-                                    "single": True
-                                })
-
-                # Pre-Output IIR EQ (8 bands)
-                if "pre_iir" in ch_config:
-                    for band_idx in range(8):
-                        band_key = str(band_idx)
-                        if band_key in ch_config["pre_iir"]:
-                            band_config = ch_config["pre_iir"][band_key]
-
-                            if "enable" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/PreIIR/Bands/Band-{band_idx}/Enable",
-                                    "data": {"type": TYPE_BOOL, "boolValue": band_config["enable"]},
-                                    "single": True
-                                })
-                            if "type" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/PreIIR/Bands/Band-{band_idx}/Type/Value",
-                                    "data": {"type": TYPE_INT, "intValue": int(band_config["type"])},
-                                    "single": True
-                                })
-                            if "fc" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/PreIIR/Bands/Band-{band_idx}/Fc/Value",
-                                    "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["fc"])},
-                                    "single": True
-                                })
-                            if "gain" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/PreIIR/Bands/Band-{band_idx}/Gain/Value",
-                                    "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["gain"])},
-                                    "single": True
-                                })
-                            if "q" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/PreIIR/Bands/Band-{band_idx}/Q/Value",
-                                    "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["q"])},
-                                    "single": True
-                                })
-                            if "slope" in band_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/PreIIR/Bands/Band-{band_idx}/Slope/Value",
-                                    "data": {"type": TYPE_INT, "intValue": int(band_config["slope"])},
-                                    "single": True
-                                })
-
-        # =================================================================
-        # v0.4.0 - Apply limiter settings (if present)
-        # =================================================================
-        if "limiters" in scene_config:
-            for ch_idx in range(4):
-                ch_key = str(ch_idx)
-                if ch_key not in scene_config["limiters"]:
-                    continue
-
-                limiter_config = scene_config["limiters"][ch_key]
-
-                # Clip limiter
-                if "clip" in limiter_config:
-                    if "enable" in limiter_config["clip"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/ClipLimiter/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": limiter_config["clip"]["enable"]},
-                            "single": True
-                        })
-                    if "threshold" in limiter_config["clip"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/ClipLimiter/Threshold/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(limiter_config["clip"]["threshold"])},
-                            "single": True
-                        })
-
-                # Peak limiter
-                if "peak" in limiter_config:
-                    if "enable" in limiter_config["peak"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/PeakLimiter/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": limiter_config["peak"]["enable"]},
-                            "single": True
-                        })
-                    if "threshold" in limiter_config["peak"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/PeakLimiter/Threshold/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(limiter_config["peak"]["threshold"])},
-                            "single": True
-                        })
-
-                # VRMS limiter
-                if "vrms" in limiter_config:
-                    if "enable" in limiter_config["vrms"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/VRMSLimiter/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": limiter_config["vrms"]["enable"]},
-                            "single": True
-                        })
-                    if "threshold" in limiter_config["vrms"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/VRMSLimiter/Threshold/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(limiter_config["vrms"]["threshold"])},
-                            "single": True
-                        })
-
-                # IRMS limiter
-                if "irms" in limiter_config:
-                    if "enable" in limiter_config["irms"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/IRMSLimiter/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": limiter_config["irms"]["enable"]},
-                            "single": True
-                        })
-                    if "threshold" in limiter_config["irms"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/IRMSLimiter/Threshold/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(limiter_config["irms"]["threshold"])},
-                            "single": True
-                        })
-
-                # Clamp limiter
-                if "clamp" in limiter_config:
-                    if "enable" in limiter_config["clamp"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/ClampLimiter/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": limiter_config["clamp"]["enable"]},
-                            "single": True
-                        })
-                    if "threshold" in limiter_config["clamp"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/ClampLimiter/Threshold/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(limiter_config["clamp"]["threshold"])},
-                            "single": True
-                        })
-
-                # Thermal limiter
-                if "thermal" in limiter_config:
-                    if "enable" in limiter_config["thermal"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/ThermalLimiter/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": limiter_config["thermal"]["enable"]},
-                            "single": True
-                        })
-                    if "threshold" in limiter_config["thermal"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/ThermalLimiter/Threshold/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(limiter_config["thermal"]["threshold"])},
-                            "single": True
-                        })
-
-                # TruePower limiter
-                if "truepower" in limiter_config:
-                    if "enable" in limiter_config["truepower"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/TruePowerLimiter/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": limiter_config["truepower"]["enable"]},
-                            "single": True
-                        })
-                    if "threshold" in limiter_config["truepower"]:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Limiters/TruePowerLimiter/Threshold/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(limiter_config["truepower"]["threshold"])},
-                            "single": True
-                        })
-
-        # =================================================================
-        # v0.4.0 - Apply crossover settings (if present)
-        # =================================================================
-        if "crossovers" in scene_config:
-            for ch_idx in range(4):
-                ch_key = str(ch_idx)
-                if ch_key not in scene_config["crossovers"]:
-                    continue
-
-                xover_config = scene_config["crossovers"][ch_key]
-                for band_idx in range(2):
-                    band_key = str(band_idx)
-                    if band_key not in xover_config:
-                        continue
-
-                    band_config = xover_config[band_key]
-
-                    if "enable" in band_config:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Xover/Bands/Band-{band_idx}/Enable",
-                            "data": {"type": TYPE_BOOL, "boolValue": band_config["enable"]},
-                            "single": True
-                        })
-                    if "fc" in band_config:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Xover/Bands/Band-{band_idx}/Fc/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(band_config["fc"])},
-                            "single": True
-                        })
-                    if "slope" in band_config:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/OutputProcess/Channels/Channel-{ch_idx}/Xover/Bands/Band-{band_idx}/Slope/Value",
-                            "data": {"type": TYPE_INT, "intValue": int(band_config["slope"])},
-                            "single": True
-                        })
-
-        # =================================================================
-        # v0.4.0 - Apply matrix mixer settings (if present)
-        # =================================================================
-        if "matrix" in scene_config:
-            matrix_config = scene_config["matrix"]
-
-            # Matrix input gains/mutes
-            if "inputs" in matrix_config:
-                for input_idx in range(4):
-                    in_key = str(input_idx)
-                    if in_key not in matrix_config["inputs"]:
-                        continue
-
-                    input_config = matrix_config["inputs"][in_key]
-
-                    if "gain" in input_config:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/InputProcess/Matrix/Inputs/Input-{input_idx}/Gain/Value",
-                            "data": {"type": TYPE_FLOAT, "floatValue": float(input_config["gain"])},
-                            "single": True
-                        })
-                    if "mute" in input_config:
-                        write_values.append({
-                            "id": f"/Device/Audio/Presets/Live/InputProcess/Matrix/Inputs/Input-{input_idx}/Mute/Value",
-                            "data": {"type": TYPE_BOOL, "boolValue": input_config["mute"]},
-                            "single": True
-                        })
-
-            # Matrix channel routing gains/mutes
-            if "channels" in matrix_config:
-                for ch_idx in range(4):
-                    ch_key = str(ch_idx)
-                    if ch_key not in matrix_config["channels"]:
-                        continue
-
-                    channel_config = matrix_config["channels"][ch_key]
-
-                    if "routing" in channel_config:
-                        for input_idx in range(4):
-                            in_key = str(input_idx)
-                            if in_key not in channel_config["routing"]:
-                                continue
-
-                            routing_config = channel_config["routing"][in_key]
-
-                            if "gain" in routing_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/InputProcess/Matrix/Channels/Channel-{ch_idx}/Routing/Input-{input_idx}/Gain/Value",
-                                    "data": {"type": TYPE_FLOAT, "floatValue": float(routing_config["gain"])},
-                                    "single": True
-                                })
-                            if "mute" in routing_config:
-                                write_values.append({
-                                    "id": f"/Device/Audio/Presets/Live/InputProcess/Matrix/Channels/Channel-{ch_idx}/Routing/Input-{input_idx}/Mute/Value",
-                                    "data": {"type": TYPE_BOOL, "boolValue": routing_config["mute"]},
-                                    "single": True
-                                })
-
-        # =================================================================
-        # Apply standby if specified
-        # =================================================================
-        if "standby" in scene_config:
-            standby = scene_config["standby"]
-            if not isinstance(standby, bool):
-                raise ValueError("Standby must be boolean")
-
-            # Note: Standby path may not be writeable on all models
-            # We'll try to write it but won't fail if it doesn't work
-            write_values.append({
-                "id": "/Device/Audio/Presets/Live/Generals/Standby/Value",
-                "data": {"type": TYPE_BOOL, "boolValue": standby},
-                "single": True
-            })
-
-        # Send batch write requests (split into chunks to avoid timeout)
+        # Send batch write requests (split to keep each request small)
         if self._session is None:
             await self.connect()
 
-        # Split write_values into batches of 100 to avoid overwhelming amplifier
-        BATCH_SIZE = 100
-        failed_writes = []
-
         try:
-            for i in range(0, len(write_values), BATCH_SIZE):
-                batch = write_values[i:i + BATCH_SIZE]
-                batch_num = (i // BATCH_SIZE) + 1
-                total_batches = (len(write_values) + BATCH_SIZE - 1) // BATCH_SIZE
-
-                _LOGGER.debug(
-                    "Applying preset batch %d/%d (%d values)",
-                    batch_num, total_batches, len(batch)
-                )
-
-                payload = {
-                    "clientId": self.client_id,
-                    "payload": {
-                        "type": "ACTION",
-                        "action": {
-                            "type": ACTION_WRITE,
-                            "values": batch
-                        }
-                    }
-                }
+            # Batches are sent concurrently, at most one per pooled
+            # connection, except the last one: it carries the standby
+            # switch, which should only change once everything else has
+            # been applied
+            limit = asyncio.Semaphore(CONNECTION_LIMIT_PER_HOST)
+            failed_writes: List[str] = []
+            results = await asyncio.gather(
+                *(self._post_writes(limit, *batch) for batch in batches[:-1]),
+                return_exceptions=True,
+            )
+            for index, result in enumerate(results, start=1):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    failed_writes.append(f"batch {index} ({result!r})")
+                else:
+                    failed_writes.extend(result)
 
-                async with async_timeout.timeout(self.timeout):
-                    async with self._session.post(
-                        f"{self.base_url}/am",
-                        json=payload,
-                        headers={"Content-Type": "application/json"}
-                    ) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                # Check results for this batch
-                action = data.get("payload", {}).get("action", {})
-                for value_obj in action.get("values", []):
-                    if value_obj.get("result") != RESULT_SUCCESS:
-                        path = value_obj.get("id")
-                        result = value_obj.get("result")
-                        # Don't fail on standby errors (may not be writeable)
-                        if "Standby" not in path:
-                            failed_writes.append(f"{path} (result={result})")
-                        else:
-                            _LOGGER.warning("Standby write not successful (may not be supported): %s", path)
+            # Leave standby untouched if the rest of the preset failed
+            if not failed_writes:
+                failed_writes.extend(
+                    await self._post_writes(limit, *batches[-1])
+                )
 
             # Check if any writes failed across all batches
             if failed_writes:
                 raise ValueError(f"Failed to write: {', '.join(failed_writes)}")
 
-            _LOGGER.info("Successfully applied preset (%d values in %d batches)", len(write_values), total_batches)
+            _LOGGER.info(
+                "Successfully applied preset (%d values in %d batches)",
+                sum(count for count, _values in batches), len(batches),
+            )
 
         except aiohttp.ClientError as err:
             _LOGGER.error("HTTP request failed to %s: %s", self.host, err)
@@ -1,25 +1,25 @@
 """Button platform for Powersoft Bias integration."""
 import logging
+import time
 from typing import Any
-from datetime import datetime
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
+from . import BiasEntryData
 from .const import (
     DOMAIN,
-    COORDINATOR,
-    CLIENT,
-    SCENE_MANAGER,
-    ACTIVE_SCENE_ID,
+    SIGNAL_SCENES_UPDATED,
     UID_SCENE,
     MANUFACTURER,
 )
 from .bias_http_client import BiasHTTPClient
+from .entity import async_sync_scene_entities
 from .scene_manager import SceneManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,9 +31,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bias button entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    client = hass.data[DOMAIN][entry.entry_id][CLIENT]
-    scene_manager: SceneManager = hass.data[DOMAIN][entry.entry_id][SCENE_MANAGER]
+    entry_data: BiasEntryData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data.coordinator
+    client = entry_data.client
+    scene_manager = entry_data.scene_manager
 
     # Add "Create Preset" button (always visible)
     entities = [
@@ -46,56 +47,135 @@ async def async_setup_entry(
         )
     ]
 
-    # Get all scenes
-    scenes = scene_manager.get_all_scenes()
+    # Per-preset entities, keyed by scene ID, so preset edits can be
+    # applied in place instead of reloading the integration
+    scene_entities: dict[int, list[ButtonEntity]] = {}
 
-    # Create button entities for each scene
-    for scene in scenes:
-        # Main scene application button
-        entities.append(
+    def _create_scene_entities(scene: dict) -> list[ButtonEntity]:
+        """Create the apply/update/delete buttons for one preset."""
+        return [
+            # Main scene application button
             BiasSceneButton(
                 coordinator,
                 client,
                 entry,
                 scene,
-            )
-        )
-
-        # Update button
-        entities.append(
+            ),
+            # Update button
             BiasSceneUpdateButton(
                 coordinator,
                 client,
                 scene_manager,
                 entry,
                 scene,
-            )
-        )
-
-        # Delete button
-        entities.append(
+            ),
+            # Delete button
             BiasSceneDeleteButton(
                 scene_manager,
                 entry,
                 scene,
                 hass,
-            )
-        )
+            ),
+        ]
 
-    async_add_entities(entities, update_before_add=True)
+    # Get all scenes
+    scenes = scene_manager.get_all_scenes()
+
+    # Create button entities for each scene
+    for scene in scenes:
+        scene_entities[scene["id"]] = _create_scene_entities(scene)
+        entities.extend(scene_entities[scene["id"]])
 
-    # Count button types for logging
-    scene_buttons = len([e for e in entities if isinstance(e, BiasSceneButton)])
-    update_buttons = len([e for e in entities if isinstance(e, BiasSceneUpdateButton)])
-    delete_buttons = len([e for e in entities if isinstance(e, BiasSceneDeleteButton)])
-    create_buttons = len([e for e in entities if isinstance(e, BiasCreateSceneButton)])
+    async_add_entities(entities, update_before_add=True)
 
+    # One create button plus apply/update/delete buttons per preset
     _LOGGER.info(
         "Added %d total button(s): %d scene, %d update, %d delete, %d create",
-        len(entities), scene_buttons, update_buttons, delete_buttons, create_buttons
+        len(entities), len(scenes), len(scenes), len(scenes), 1
     )
     _LOGGER.info("Custom presets: %d", scene_manager.get_custom_scene_count())
 
+    @callback
+    def _async_sync_scenes() -> None:
+        """Add, remove and refresh preset buttons to match the scene manager."""
+        scenes = scene_manager.get_all_scenes()
+        added = async_sync_scene_entities(
+            hass, scene_entities, scenes, _create_scene_entities, async_add_entities
+        )
+        _LOGGER.debug("Synced preset buttons: %d preset(s), %d added", len(scenes), added)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_SCENES_UPDATED.format(entry_id=entry.entry_id), _async_sync_scenes
+        )
+    )
+
+
+def _normalize_bool(value):
+    """Convert various boolean representations to actual bool."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return bool(value)
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
+
+
+def _normalize_preset_data(data: dict) -> dict:
+    """Normalize coordinator data types for preset validation."""
+    if not data:
+        return data
+
+    normalized = data.copy()
+
+    # Normalize output channels
+    if "output_channels" in normalized:
+        for ch_key, ch_config in normalized["output_channels"].items():
+            if "enable" in ch_config:
+                ch_config["enable"] = _normalize_bool(ch_config["enable"])
+            if "mute" in ch_config:
+                ch_config["mute"] = _normalize_bool(ch_config["mute"])
+            if "polarity" in ch_config:
+                ch_config["polarity"] = _normalize_bool(ch_config["polarity"])
+            if "delay_enable" in ch_config:
+                ch_config["delay_enable"] = _normalize_bool(ch_config["delay_enable"])
+
+    # Normalize input channels
+    if "input_channels" in normalized:
+        for ch_key, ch_config in normalized["input_channels"].items():
+            if "enable" in ch_config:
+                ch_config["enable"] = _normalize_bool(ch_config["enable"])
+            if "mute" in ch_config:
+                ch_config["mute"] = _normalize_bool(ch_config["mute"])
+            if "polarity" in ch_config:
+                ch_config["polarity"] = _normalize_bool(ch_config["polarity"])
+            if "delay_enable" in ch_config:
+                ch_config["delay_enable"] = _normalize_bool(ch_config["delay_enable"])
+
+    # Normalize standby
+    if "standby" in normalized:
+        normalized["standby"] = _normalize_bool(normalized["standby"])
+
+    return normalized
+
+
+def _scene_attributes(scene_config: dict) -> dict[str, Any]:
+    """Return the state attributes of a preset button."""
+    attrs = {
+        "scene_id": scene_config["id"],
+        "output_channels": scene_config.get("output_channels", {}),
+        "standby": scene_config.get("standby", False),
+    }
+
+    # Add timestamps if available
+    if "created_at" in scene_config:
+        attrs["created_at"] = scene_config["created_at"]
+    if "updated_at" in scene_config:
+        attrs["updated_at"] = scene_config["updated_at"]
+
+    return attrs
+
 
 class BiasSceneButton(CoordinatorEntity, ButtonEntity):
     """Representation of a preset button."""
@@ -123,23 +203,17 @@ class BiasSceneButton(CoordinatorEntity, ButtonEntity):
         }
         self._attr_unique_id = f"{entry.entry_id}_{UID_SCENE}_{scene_config['id']}"
         self._attr_name = f"Preset - {scene_config['name']}"
+        self._attr_extra_state_attributes = _scene_attributes(scene_config)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        attrs = {
-            "scene_id": self._scene_config["id"],
-            "output_channels": self._scene_config.get("output_channels", {}),
-            "standby": self._scene_config.get("standby", False),
-        }
-
-        # Add timestamps if available
-        if "created_at" in self._scene_config:
-            attrs["created_at"] = self._scene_config["created_at"]
-        if "updated_at" in self._scene_config:
-            attrs["updated_at"] = self._scene_config["updated_at"]
-
-        return attrs
+    @callback
+    def async_update_scene(self, scene_config: dict) -> None:
+        """Refresh the button after its preset was updated or renamed."""
+        self._scene_config = scene_config
+        self._attr_name = f"Preset - {scene_config['name']}"
+        self._attr_extra_state_attributes = _scene_attributes(scene_config)
+        # Entities never added to hass (e.g. disabled ones) have no state
+        if self.hass is not None:
+            self.async_write_ha_state()
 
     async def async_press(self) -> None:
         """Handle the button press - apply the preset."""
@@ -148,9 +222,10 @@ class BiasSceneButton(CoordinatorEntity, ButtonEntity):
             await self._client.apply_scene(self._scene_config)
 
             # Update active scene tracking
-            self.hass.data[DOMAIN][self._entry.entry_id][ACTIVE_SCENE_ID] = self._scene_config["id"]
+            self.hass.data[DOMAIN][self._entry.entry_id].active_scene_id = self._scene_config["id"]
 
-            # Force immediate coordinator refresh to show new state
+            # Resume fast polling and force an immediate refresh to show new state
+            await self.coordinator.async_reset_backoff()
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error(
@@ -189,13 +264,22 @@ class BiasSceneUpdateButton(CoordinatorEntity, ButtonEntity):
         self._attr_unique_id = f"{entry.entry_id}_{UID_SCENE}_{scene_config['id']}_update"
         self._attr_name = f"Preset - Update '{scene_config['name']}'"
 
+    @callback
+    def async_update_scene(self, scene_config: dict) -> None:
+        """Refresh the button after its preset was updated or renamed."""
+        self._scene_config = scene_config
+        self._attr_name = f"Preset - Update '{scene_config['name']}'"
+        # Entities never added to hass (e.g. disabled ones) have no state
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     async def async_press(self) -> None:
         """Handle button press - update the preset with current amp state."""
         try:
             _LOGGER.info("Updating preset: %s", self._scene_config["name"])
 
-            # Capture current amplifier state
-            config = await self._client.capture_current_state()
+            # Use coordinator data instead of querying amplifier again
+            config = _normalize_preset_data(self.coordinator.snapshot())
 
             # Update the scene
             await self._scene_manager.async_update_scene(
@@ -204,8 +288,8 @@ class BiasSceneUpdateButton(CoordinatorEntity, ButtonEntity):
 
             _LOGGER.info("Successfully updated preset '%s'", self._scene_config["name"])
 
-            # Reload integration to refresh all buttons
-            await self.hass.config_entries.async_reload(self._entry.entry_id)
+            # Refresh preset buttons in place
+            await self.hass.data[DOMAIN][self._entry.entry_id].scene_sync_debouncer.async_call()
 
         except Exception as err:
             _LOGGER.error(
@@ -242,6 +326,15 @@ class BiasSceneDeleteButton(ButtonEntity):
         self._attr_unique_id = f"{entry.entry_id}_{UID_SCENE}_{scene_config['id']}_delete"
         self._attr_name = f"Preset - Delete '{scene_config['name']}'"
 
+    @callback
+    def async_update_scene(self, scene_config: dict) -> None:
+        """Refresh the button after its preset was updated or renamed."""
+        self._scene_config = scene_config
+        self._attr_name = f"Preset - Delete '{scene_config['name']}'"
+        # Entities never added to hass (e.g. disabled ones) have no state
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     async def async_press(self) -> None:
         """Handle button press - delete the preset."""
         try:
@@ -255,8 +348,8 @@ class BiasSceneDeleteButton(ButtonEntity):
 
             _LOGGER.info("Successfully deleted preset '%s'", scene_name)
 
-            # Reload integration to refresh all buttons
-            await self._hass.config_entries.async_reload(self._entry.entry_id)
+            # Refresh preset buttons in place
+            await self._hass.data[DOMAIN][self._entry.entry_id].scene_sync_debouncer.async_call()
 
         except Exception as err:
             _LOGGER.error(
@@ -295,68 +388,21 @@ class BiasCreateSceneButton(CoordinatorEntity, ButtonEntity):
         self._attr_unique_id = f"{entry.entry_id}_create_scene"
         self._attr_name = "Preset - Create New"
 
-    def _normalize_bool(self, value):
-        """Convert various boolean representations to actual bool."""
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, int):
-            return bool(value)
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
-        return bool(value)
-
-    def _normalize_preset_data(self, data: dict) -> dict:
-        """Normalize coordinator data types for preset validation."""
-        if not data:
-            return data
-
-        normalized = data.copy()
-
-        # Normalize output channels
-        if "output_channels" in normalized:
-            for ch_key, ch_config in normalized["output_channels"].items():
-                if "enable" in ch_config:
-                    ch_config["enable"] = self._normalize_bool(ch_config["enable"])
-                if "mute" in ch_config:
-                    ch_config["mute"] = self._normalize_bool(ch_config["mute"])
-                if "polarity" in ch_config:
-                    ch_config["polarity"] = self._normalize_bool(ch_config["polarity"])
-                if "delay_enable" in ch_config:
-                    ch_config["delay_enable"] = self._normalize_bool(ch_config["delay_enable"])
-
-        # Normalize input channels
-        if "input_channels" in normalized:
-            for ch_key, ch_config in normalized["input_channels"].items():
-                if "enable" in ch_config:
-                    ch_config["enable"] = self._normalize_bool(ch_config["enable"])
-                if "mute" in ch_config:
-                    ch_config["mute"] = self._normalize_bool(ch_config["mute"])
-                if "polarity" in ch_config:
-                    ch_config["polarity"] = self._normalize_bool(ch_config["polarity"])
-                if "delay_enable" in ch_config:
-                    ch_config["delay_enable"] = self._normalize_bool(ch_config["delay_enable"])
-
-        # Normalize standby
-        if "standby" in normalized:
-            normalized["standby"] = self._normalize_bool(normalized["standby"])
-
-        return normalized
-
     async def async_press(self) -> None:
         """Handle button press - create new preset from current amp state."""
         try:
             # Generate preset name with timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             scene_name = f"Preset {timestamp}"
 
             _LOGGER.info("Creating new preset: %s", scene_name)
 
             # Use coordinator data instead of querying amplifier again
             # This avoids timeout issues with 729 path requests
-            raw_config = self.coordinator.data.copy() if self.coordinator.data else {}
+            raw_config = self.coordinator.snapshot()
 
             # Normalize data types for preset validation
-            config = self._normalize_preset_data(raw_config)
+            config = _normalize_preset_data(raw_config)
 
             # Create the scene
             scene_id = await self._scene_manager.async_create_scene(scene_name, config)
@@ -376,8 +422,8 @@ class BiasCreateSceneButton(CoordinatorEntity, ButtonEntity):
                 },
             )
 
-            # Reload integration to show new buttons
-            await self._hass.config_entries.async_reload(self._entry.entry_id)
+            # Add buttons for the new preset
+            await self._hass.data[DOMAIN][self._entry.entry_id].scene_sync_debouncer.async_call()
 
         except Exception as err:
             _LOGGER.error("Failed to create preset: %s", err)
@@ -12,6 +12,9 @@ CONF_SCAN_INTERVAL: Final = "scan_interval"
 DEFAULT_PORT: Final = 80
 DEFAULT_SCAN_INTERVAL: Final = 10  # seconds
 DEFAULT_TIMEOUT: Final = 15.0  # seconds (increased for DSP parameter batching and preset operations)
+PRESET_SYNC_COOLDOWN: Final = 0.5  # seconds (coalesces back-to-back preset edits)
+MAX_IDLE_SCAN_INTERVAL: Final = 300  # seconds (ceiling for idle polling backoff)
+DEVICE_INFO_REFRESH_INTERVAL: Final = 3600  # seconds (firmware/model info rarely changes)
 
 # Device info
 MANUFACTURER: Final = "Powersoft"
@@ -232,13 +235,11 @@ EQ_FILTER_TYPES: Final = {
 }
 
 # =============================================================================
-# Data coordinator keys
+# Dispatcher signals
 # =============================================================================
 
-COORDINATOR: Final = "coordinator"
-CLIENT: Final = "client"
-SCENE_MANAGER: Final = "scene_manager"
-ACTIVE_SCENE_ID: Final = "active_scene_id"
+# Dispatcher signal sent when presets change (format with entry_id)
+SIGNAL_SCENES_UPDATED: Final = f"{DOMAIN}_scenes_updated_{{entry_id}}"
 
 # Entity unique ID prefixes
 UID_SCENE: Final = "scene"
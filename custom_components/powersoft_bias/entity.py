@@ -0,0 +1,51 @@
+"""Shared entity helpers for Powersoft Bias integration."""
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+
+@callback
+def async_sync_scene_entities(
+    hass: HomeAssistant,
+    scene_entities: dict[int, list[Entity]],
+    scenes: list[dict[str, Any]],
+    create_entities: Callable[[dict[str, Any]], list[Entity]],
+    async_add_entities: AddEntitiesCallback,
+) -> int:
+    """Add, remove and refresh per-preset entities to match the presets.
+
+    scene_entities maps preset IDs to their entities and is updated in
+    place. Existing entities are refreshed through their async_update_scene().
+    Returns the number of presets whose entities were added.
+    """
+    scenes_by_id = {scene["id"]: scene for scene in scenes}
+    new_entities: list[Entity] = []
+    added = 0
+
+    for scene_id, scene in scenes_by_id.items():
+        entities = scene_entities.get(scene_id)
+        if entities is not None:
+            for entity in entities:
+                entity.async_update_scene(scene)
+        else:
+            scene_entities[scene_id] = entities = create_entities(scene)
+            new_entities.extend(entities)
+            added += 1
+
+    ent_reg = er.async_get(hass)
+    for scene_id in set(scene_entities) - set(scenes_by_id):
+        for entity in scene_entities.pop(scene_id):
+            if entity.registry_entry is not None:
+                # Removing the registry entry also removes the entity
+                ent_reg.async_remove(entity.entity_id)
+            elif entity.hass is not None:
+                hass.async_create_task(entity.async_remove(force_remove=True))
+
+    if new_entities:
+        async_add_entities(new_entities)
+
+    return added
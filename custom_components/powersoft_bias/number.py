@@ -14,7 +14,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BiasDataUpdateCoordinator
 from .const import (
-    COORDINATOR,
     DOMAIN,
     MANUFACTURER,
     MAX_CHANNELS,
@@ -120,7 +119,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bias number entities."""
-    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id].coordinator
 
     entities = []
 
@@ -205,6 +204,7 @@ class BiasOutputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
         """Initialize the gain control."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_gain"
         self._attr_name = f"Output {channel + 1} Gain"
 
@@ -219,7 +219,7 @@ class BiasOutputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
     def native_value(self) -> float | None:
         """Return the current gain value in dB."""
         if self.coordinator.data:
-            linear_gain = self.coordinator.data.get("output_channels", {}).get(str(self._channel), {}).get("gain")
+            linear_gain = self.coordinator.data.get("output_channels", {}).get(self._channel_key, {}).get("gain")
             if linear_gain is not None:
                 return round(linear_to_db(linear_gain), 1)
         return None
@@ -232,16 +232,10 @@ class BiasOutputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
         linear_value = db_to_linear(value)
 
         try:
-            await self.coordinator.client.write_value(path, linear_value)
+            await self.coordinator.async_write_value(path, linear_value)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["gain"] = linear_value
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(linear_value, "output_channels", self._channel_key, "gain")
 
         except Exception as err:
             _LOGGER.error("Failed to set output gain for channel %d: %s", self._channel, err)
@@ -268,6 +262,7 @@ class BiasOutputDelay(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity
         """Initialize the delay control."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_delay"
         self._attr_name = f"Output {channel + 1} Delay"
 
@@ -282,7 +277,7 @@ class BiasOutputDelay(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity
     def native_value(self) -> float | None:
         """Return the current delay value."""
         if self.coordinator.data:
-            return self.coordinator.data.get("output_channels", {}).get(str(self._channel), {}).get("delay")
+            return self.coordinator.data.get("output_channels", {}).get(self._channel_key, {}).get("delay")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
@@ -290,16 +285,10 @@ class BiasOutputDelay(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity
         path = PATH_CHANNEL_OUT_DELAY_VALUE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, value)
+            await self.coordinator.async_write_value(path, value)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["delay"] = value
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "delay")
 
         except Exception as err:
             _LOGGER.error("Failed to set output delay for channel %d: %s", self._channel, err)
@@ -329,6 +318,7 @@ class BiasInputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity):
         """Initialize the input gain control."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_gain"
         self._attr_name = f"Input {channel + 1} Gain"
 
@@ -343,7 +333,7 @@ class BiasInputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity):
     def native_value(self) -> float | None:
         """Return the current input gain value in dB."""
         if self.coordinator.data:
-            linear_gain = self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("gain")
+            linear_gain = self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("gain")
             if linear_gain is not None:
                 return round(linear_to_db(linear_gain), 1)
         return None
@@ -356,16 +346,10 @@ class BiasInputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity):
         linear_value = db_to_linear(value)
 
         try:
-            await self.coordinator.client.write_value(path, linear_value)
+            await self.coordinator.async_write_value(path, linear_value)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["gain"] = linear_value
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(linear_value, "input_channels", self._channel_key, "gain")
 
         except Exception as err:
             _LOGGER.error("Failed to set input gain for channel %d: %s", self._channel, err)
@@ -392,6 +376,7 @@ class BiasInputShadingGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberE
         """Initialize the shading gain control."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_shading_gain"
         self._attr_name = f"Input {channel + 1} Shading Gain"
 
@@ -406,7 +391,7 @@ class BiasInputShadingGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberE
     def native_value(self) -> float | None:
         """Return the current shading gain value in dB."""
         if self.coordinator.data:
-            linear_gain = self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("shading_gain")
+            linear_gain = self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("shading_gain")
             if linear_gain is not None:
                 return round(linear_to_db(linear_gain), 1)
         return None
@@ -419,16 +404,10 @@ class BiasInputShadingGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberE
         linear_value = db_to_linear(value)
 
         try:
-            await self.coordinator.client.write_value(path, linear_value)
+            await self.coordinator.async_write_value(path, linear_value)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["shading_gain"] = linear_value
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(linear_value, "input_channels", self._channel_key, "shading_gain")
 
         except Exception as err:
             _LOGGER.error("Failed to set shading gain for input %d: %s", self._channel, err)
@@ -455,6 +434,7 @@ class BiasInputDelay(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
         """Initialize the input delay control."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_delay"
         self._attr_name = f"Input {channel + 1} Delay"
 
@@ -469,7 +449,7 @@ class BiasInputDelay(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
     def native_value(self) -> float | None:
         """Return the current input delay value."""
         if self.coordinator.data:
-            return self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("delay")
+            return self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("delay")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
@@ -477,16 +457,10 @@ class BiasInputDelay(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
         path = PATH_INPUT_DELAY_VALUE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, value)
+            await self.coordinator.async_write_value(path, value)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["delay"] = value
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(value, "input_channels", self._channel_key, "delay")
 
         except Exception as err:
             _LOGGER.error("Failed to set input delay for channel %d: %s", self._channel, err)
@@ -526,7 +500,9 @@ class BiasOutputIIRFrequency(CoordinatorEntity[BiasDataUpdateCoordinator], Numbe
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_iir_{band}_fc"
         self._attr_name = f"Output {channel + 1} EQ Band {band + 1} Frequency"
         self._attr_device_info = DeviceInfo(
@@ -540,25 +516,15 @@ class BiasOutputIIRFrequency(CoordinatorEntity[BiasDataUpdateCoordinator], Numbe
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("fc")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("fc")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_OUTPUT_IIR_FC.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)]["fc"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "iir", self._band_key, "fc")
         except Exception as err:
             _LOGGER.error("Failed to set output IIR fc: %s", err)
             raise
@@ -578,7 +544,9 @@ class BiasOutputIIRGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEnti
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_iir_{band}_gain"
         self._attr_name = f"Output {channel + 1} EQ Band {band + 1} Gain"
         self._attr_device_info = DeviceInfo(
@@ -593,8 +561,8 @@ class BiasOutputIIRGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEnti
         if self.coordinator.data:
             # EQ API stores dB directly, not linear gain
             db_gain = self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("gain")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("gain")
             if db_gain is not None:
                 return round(float(db_gain), 1)
         return None
@@ -604,18 +572,8 @@ class BiasOutputIIRGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEnti
         # EQ API expects dB directly, not linear gain
         db_value = float(value)
         try:
-            await self.coordinator.client.write_value(path, db_value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)]["gain"] = db_value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, db_value)
+            self.coordinator.async_update_local(db_value, "output_channels", self._channel_key, "iir", self._band_key, "gain")
         except Exception as err:
             _LOGGER.error("Failed to set output IIR gain: %s", err)
             raise
@@ -634,7 +592,9 @@ class BiasOutputIIRQ(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_iir_{band}_q"
         self._attr_name = f"Output {channel + 1} EQ Band {band + 1} Q"
         self._attr_device_info = DeviceInfo(
@@ -648,25 +608,15 @@ class BiasOutputIIRQ(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEntity)
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("q")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("q")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_OUTPUT_IIR_Q.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)]["q"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "iir", self._band_key, "q")
         except Exception as err:
             _LOGGER.error("Failed to set output IIR Q: %s", err)
             raise
@@ -685,25 +635,15 @@ class BiasPreOutputIIRFrequency(BiasOutputIIRFrequency):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("pre_output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("fc")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("fc")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_PRE_OUTPUT_IIR_FC.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "pre_output_channels" not in self.coordinator.data:
-                    self.coordinator.data["pre_output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["pre_output_channels"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["pre_output_channels"][str(self._channel)]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)]["fc"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "pre_output_channels", self._channel_key, "iir", self._band_key, "fc")
         except Exception as err:
             _LOGGER.error("Failed to set pre-output IIR fc: %s", err)
             raise
@@ -720,8 +660,8 @@ class BiasPreOutputIIRGain(BiasOutputIIRGain):
         if self.coordinator.data:
             # Speaker (Pre-Output) EQ API stores dB directly, not linear gain
             db_gain = self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
-            ).get("pre_iir", {}).get(str(self._band), {}).get("gain")
+                self._channel_key, {}
+            ).get("pre_iir", {}).get(self._band_key, {}).get("gain")
             if db_gain is not None:
                 return round(float(db_gain), 1)
         return None
@@ -731,18 +671,8 @@ class BiasPreOutputIIRGain(BiasOutputIIRGain):
         # Speaker (Pre-Output) EQ API expects dB directly, not linear gain
         db_value = float(value)
         try:
-            await self.coordinator.client.write_value(path, db_value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "pre_iir" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["pre_iir"] = {}
-                if str(self._band) not in self.coordinator.data["output_channels"][str(self._channel)]["pre_iir"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["pre_iir"][str(self._band)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["pre_iir"][str(self._band)]["gain"] = db_value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, db_value)
+            self.coordinator.async_update_local(db_value, "output_channels", self._channel_key, "pre_iir", self._band_key, "gain")
         except Exception as err:
             _LOGGER.error("Failed to set pre-output IIR gain: %s", err)
             raise
@@ -758,25 +688,15 @@ class BiasPreOutputIIRQ(BiasOutputIIRQ):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("pre_output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("q")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("q")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_PRE_OUTPUT_IIR_Q.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "pre_output_channels" not in self.coordinator.data:
-                    self.coordinator.data["pre_output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["pre_output_channels"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["pre_output_channels"][str(self._channel)]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)]["q"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "pre_output_channels", self._channel_key, "iir", self._band_key, "q")
         except Exception as err:
             _LOGGER.error("Failed to set pre-output IIR Q: %s", err)
             raise
@@ -793,25 +713,15 @@ class BiasInputIIRFrequency(BiasOutputIIRFrequency):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("input_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("fc")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("fc")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_INPUT_ZONE_IIR_FC.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["input_channels"][str(self._channel)]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["input_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)]["fc"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "input_channels", self._channel_key, "iir", self._band_key, "fc")
         except Exception as err:
             _LOGGER.error("Failed to set input IIR fc: %s", err)
             raise
@@ -828,8 +738,8 @@ class BiasInputIIRGain(BiasOutputIIRGain):
         if self.coordinator.data:
             # Input EQ API stores dB directly, not linear gain
             db_gain = self.coordinator.data.get("input_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("gain")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("gain")
             if db_gain is not None:
                 return round(float(db_gain), 1)
         return None
@@ -839,18 +749,8 @@ class BiasInputIIRGain(BiasOutputIIRGain):
         # Input EQ API expects dB directly, not linear gain
         db_value = float(value)
         try:
-            await self.coordinator.client.write_value(path, db_value)
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["input_channels"][str(self._channel)]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["input_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)]["gain"] = db_value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, db_value)
+            self.coordinator.async_update_local(db_value, "input_channels", self._channel_key, "iir", self._band_key, "gain")
         except Exception as err:
             _LOGGER.error("Failed to set input IIR gain: %s", err)
             raise
@@ -866,25 +766,15 @@ class BiasInputIIRQ(BiasOutputIIRQ):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("input_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("q")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("q")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_INPUT_ZONE_IIR_Q.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["input_channels"][str(self._channel)]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["input_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)]["q"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "input_channels", self._channel_key, "iir", self._band_key, "q")
         except Exception as err:
             _LOGGER.error("Failed to set input IIR Q: %s", err)
             raise
@@ -908,6 +798,7 @@ class BiasClipLimiterThreshold(CoordinatorEntity[BiasDataUpdateCoordinator], Num
     def __init__(self, coordinator, entry, channel: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_clip_limiter_threshold"
         self._attr_name = f"Output {channel + 1} Clip Limiter Threshold"
         self._attr_device_info = DeviceInfo(
@@ -921,25 +812,15 @@ class BiasClipLimiterThreshold(CoordinatorEntity[BiasDataUpdateCoordinator], Num
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("clip", {}).get("threshold")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_LIMITER_CLIP_THRESHOLD.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "clip" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clip"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clip"]["threshold"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "limiters", "clip", "threshold")
         except Exception as err:
             _LOGGER.error("Failed to set clip limiter threshold: %s", err)
             raise
@@ -956,25 +837,15 @@ class BiasPeakLimiterThreshold(BiasClipLimiterThreshold):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("peak", {}).get("threshold")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_LIMITER_PEAK_THRESHOLD.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "peak" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["peak"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["peak"]["threshold"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "limiters", "peak", "threshold")
         except Exception as err:
             _LOGGER.error("Failed to set peak limiter threshold: %s", err)
             raise
@@ -993,25 +864,15 @@ class BiasVRMSLimiterThreshold(BiasClipLimiterThreshold):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("vrms", {}).get("threshold")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_LIMITER_VRMS_THRESHOLD.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "vrms" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["vrms"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["vrms"]["threshold"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "limiters", "vrms", "threshold")
         except Exception as err:
             _LOGGER.error("Failed to set VRMS limiter threshold: %s", err)
             raise
@@ -1030,25 +891,15 @@ class BiasIRMSLimiterThreshold(BiasClipLimiterThreshold):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("irms", {}).get("threshold")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_LIMITER_IRMS_THRESHOLD.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "irms" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["irms"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["irms"]["threshold"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "limiters", "irms", "threshold")
         except Exception as err:
             _LOGGER.error("Failed to set IRMS limiter threshold: %s", err)
             raise
@@ -1064,25 +915,15 @@ class BiasClampLimiterThreshold(BiasIRMSLimiterThreshold):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("clamp", {}).get("threshold")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_LIMITER_CLAMP_THRESHOLD.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "clamp" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clamp"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clamp"]["threshold"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "limiters", "clamp", "threshold")
         except Exception as err:
             _LOGGER.error("Failed to set clamp limiter threshold: %s", err)
             raise
@@ -1101,25 +942,15 @@ class BiasThermalLimiterThreshold(BiasClipLimiterThreshold):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("thermal", {}).get("threshold")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_LIMITER_THERMAL_THRESHOLD.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "thermal" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["thermal"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["thermal"]["threshold"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "limiters", "thermal", "threshold")
         except Exception as err:
             _LOGGER.error("Failed to set thermal limiter threshold: %s", err)
             raise
@@ -1138,25 +969,15 @@ class BiasTruePowerLimiterThreshold(BiasClipLimiterThreshold):
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("truepower", {}).get("threshold")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_LIMITER_TRUEPOWER_THRESHOLD.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "truepower" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["truepower"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["truepower"]["threshold"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "output_channels", self._channel_key, "limiters", "truepower", "threshold")
         except Exception as err:
             _LOGGER.error("Failed to set truepower limiter threshold: %s", err)
             raise
@@ -1180,7 +1001,9 @@ class BiasCrossoverFrequency(CoordinatorEntity[BiasDataUpdateCoordinator], Numbe
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_xover_{band}_fc"
         self._attr_name = f"Output {channel + 1} Crossover Band {band + 1} Frequency"
         self._attr_device_info = DeviceInfo(
@@ -1194,25 +1017,15 @@ class BiasCrossoverFrequency(CoordinatorEntity[BiasDataUpdateCoordinator], Numbe
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("pre_output_channels", {}).get(
-                str(self._channel), {}
-            ).get("crossover", {}).get(str(self._band), {}).get("fc")
+                self._channel_key, {}
+            ).get("crossover", {}).get(self._band_key, {}).get("fc")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_XOVER_FC.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "pre_output_channels" not in self.coordinator.data:
-                    self.coordinator.data["pre_output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["pre_output_channels"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)] = {}
-                if "crossover" not in self.coordinator.data["pre_output_channels"][str(self._channel)]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"] = {}
-                if str(self._band) not in self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"][str(self._band)] = {}
-                self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"][str(self._band)]["fc"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "pre_output_channels", self._channel_key, "crossover", self._band_key, "fc")
         except Exception as err:
             _LOGGER.error("Failed to set crossover frequency: %s", err)
             raise
@@ -1232,7 +1045,9 @@ class BiasCrossoverSlope(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEnt
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_xover_{band}_slope"
         self._attr_name = f"Output {channel + 1} Crossover Band {band + 1} Slope"
         self._attr_device_info = DeviceInfo(
@@ -1246,25 +1061,15 @@ class BiasCrossoverSlope(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEnt
     def native_value(self) -> float | None:
         if self.coordinator.data:
             return self.coordinator.data.get("pre_output_channels", {}).get(
-                str(self._channel), {}
-            ).get("crossover", {}).get(str(self._band), {}).get("slope")
+                self._channel_key, {}
+            ).get("crossover", {}).get(self._band_key, {}).get("slope")
         return None
 
     async def async_set_native_value(self, value: float) -> None:
         path = PATH_XOVER_SLOPE.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, value)
-            if self.coordinator.data:
-                if "pre_output_channels" not in self.coordinator.data:
-                    self.coordinator.data["pre_output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["pre_output_channels"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)] = {}
-                if "crossover" not in self.coordinator.data["pre_output_channels"][str(self._channel)]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"] = {}
-                if str(self._band) not in self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"][str(self._band)] = {}
-                self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"][str(self._band)]["slope"] = value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, value)
+            self.coordinator.async_update_local(value, "pre_output_channels", self._channel_key, "crossover", self._band_key, "slope")
         except Exception as err:
             _LOGGER.error("Failed to set crossover slope: %s", err)
             raise
@@ -1288,6 +1093,7 @@ class BiasMatrixInputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEn
     def __init__(self, coordinator, entry, input_ch: int) -> None:
         super().__init__(coordinator)
         self._input_ch = input_ch
+        self._input_ch_key = str(input_ch)
         self._attr_unique_id = f"{entry.entry_id}_matrix_input_{input_ch}_gain"
         self._attr_name = f"Matrix Input {input_ch + 1} Gain"
         self._attr_device_info = DeviceInfo(
@@ -1300,7 +1106,7 @@ class BiasMatrixInputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEn
     @property
     def native_value(self) -> float | None:
         if self.coordinator.data:
-            linear_gain = self.coordinator.data.get("matrix", {}).get("inputs", {}).get(str(self._input_ch), {}).get("gain")
+            linear_gain = self.coordinator.data.get("matrix", {}).get("inputs", {}).get(self._input_ch_key, {}).get("gain")
             if linear_gain is not None:
                 return round(linear_to_db(linear_gain), 1)
         return None
@@ -1309,16 +1115,8 @@ class BiasMatrixInputGain(CoordinatorEntity[BiasDataUpdateCoordinator], NumberEn
         path = PATH_MATRIX_IN_GAIN.format(input=self._input_ch)
         linear_value = db_to_linear(value)
         try:
-            await self.coordinator.client.write_value(path, linear_value)
-            if self.coordinator.data:
-                if "matrix" not in self.coordinator.data:
-                    self.coordinator.data["matrix"] = {}
-                if "inputs" not in self.coordinator.data["matrix"]:
-                    self.coordinator.data["matrix"]["inputs"] = {}
-                if str(self._input_ch) not in self.coordinator.data["matrix"]["inputs"]:
-                    self.coordinator.data["matrix"]["inputs"][str(self._input_ch)] = {}
-                self.coordinator.data["matrix"]["inputs"][str(self._input_ch)]["gain"] = linear_value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, linear_value)
+            self.coordinator.async_update_local(linear_value, "matrix", "inputs", self._input_ch_key, "gain")
         except Exception as err:
             _LOGGER.error("Failed to set matrix input gain: %s", err)
             raise
@@ -1338,7 +1136,9 @@ class BiasMatrixChannelGain(CoordinatorEntity[BiasDataUpdateCoordinator], Number
     def __init__(self, coordinator, entry, channel: int, input_ch: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._input_ch = input_ch
+        self._input_ch_key = str(input_ch)
         self._attr_unique_id = f"{entry.entry_id}_matrix_ch{channel}_in{input_ch}_gain"
         self._attr_name = f"Matrix Output {channel + 1} Input {input_ch + 1} Gain"
         self._attr_device_info = DeviceInfo(
@@ -1352,8 +1152,8 @@ class BiasMatrixChannelGain(CoordinatorEntity[BiasDataUpdateCoordinator], Number
     def native_value(self) -> float | None:
         if self.coordinator.data:
             linear_gain = self.coordinator.data.get("matrix", {}).get("channels", {}).get(
-                str(self._channel), {}
-            ).get("routing", {}).get(str(self._input_ch), {}).get("gain")
+                self._channel_key, {}
+            ).get("routing", {}).get(self._input_ch_key, {}).get("gain")
             if linear_gain is not None:
                 return round(linear_to_db(linear_gain), 1)
         return None
@@ -1362,20 +1162,8 @@ class BiasMatrixChannelGain(CoordinatorEntity[BiasDataUpdateCoordinator], Number
         path = PATH_MATRIX_CHANNEL_GAIN.format(channel=self._channel, input=self._input_ch)
         linear_value = db_to_linear(value)
         try:
-            await self.coordinator.client.write_value(path, linear_value)
-            if self.coordinator.data:
-                if "matrix" not in self.coordinator.data:
-                    self.coordinator.data["matrix"] = {}
-                if "channels" not in self.coordinator.data["matrix"]:
-                    self.coordinator.data["matrix"]["channels"] = {}
-                if str(self._channel) not in self.coordinator.data["matrix"]["channels"]:
-                    self.coordinator.data["matrix"]["channels"][str(self._channel)] = {}
-                if "routing" not in self.coordinator.data["matrix"]["channels"][str(self._channel)]:
-                    self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"] = {}
-                if str(self._input_ch) not in self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"]:
-                    self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"][str(self._input_ch)] = {}
-                self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"][str(self._input_ch)]["gain"] = linear_value
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, linear_value)
+            self.coordinator.async_update_local(linear_value, "matrix", "channels", self._channel_key, "routing", self._input_ch_key, "gain")
         except Exception as err:
             _LOGGER.error("Failed to set matrix channel gain: %s", err)
             raise
@@ -7,7 +7,7 @@ import logging
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,6 +15,9 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_VERSION = 1
 STORAGE_KEY = "powersoft_bias_presets"
 
+# Delay before presets are written to disk; edits within it share one write
+SAVE_DELAY = 1  # seconds
+
 # Custom scene IDs start at 1
 CUSTOM_SCENE_ID_START = 1
 
@@ -43,6 +46,7 @@ class SceneManager:
         )
         self._custom_scenes: List[Dict[str, Any]] = []
         self._next_id = CUSTOM_SCENE_ID_START
+        self._save_pending = False
 
     async def async_load(self) -> None:
         """Load scenes from storage."""
@@ -65,14 +69,33 @@ class SceneManager:
 
         _LOGGER.info("Loaded %d custom preset(s)", len(self._custom_scenes))
 
-    async def async_save(self) -> None:
-        """Save scenes to storage."""
-        data = {
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to write to storage."""
+        self._save_pending = False
+        _LOGGER.debug("Saving %d custom preset(s)", len(self._custom_scenes))
+        return {
             "version": STORAGE_VERSION,
             "scenes": self._custom_scenes,
         }
-        await self._store.async_save(data)
-        _LOGGER.debug("Saved %d custom preset(s)", len(self._custom_scenes))
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving scenes to storage.
+
+        The write happens off the event loop after SAVE_DELAY, so callers
+        don't wait on disk I/O. Pending writes are flushed on shutdown.
+        """
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_unload(self) -> None:
+        """Write edits still waiting for their delayed save.
+
+        A reload within SAVE_DELAY of an edit would otherwise load the
+        previous presets from storage.
+        """
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
 
     def get_all_scenes(self) -> List[Dict[str, Any]]:
         """
@@ -246,7 +269,7 @@ class SceneManager:
         }
 
         self._custom_scenes.append(scene)
-        await self.async_save()
+        self.async_schedule_save()
 
         _LOGGER.info("Created preset '%s' (ID: %d)", name, use_id)
         return use_id
@@ -291,7 +314,7 @@ class SceneManager:
             "updated_at": now,
         })
 
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.info("Updated preset ID %d", scene_id)
 
     async def async_delete_scene(self, scene_id: int) -> None:
@@ -311,7 +334,7 @@ class SceneManager:
         if len(self._custom_scenes) == initial_count:
             raise ValueError(f"Scene ID {scene_id} not found")
 
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.info("Deleted preset ID %d", scene_id)
 
     async def async_rename_scene(self, scene_id: int, new_name: str) -> None:
@@ -345,7 +368,7 @@ class SceneManager:
         self._custom_scenes[scene_idx]["name"] = new_name.strip()
         self._custom_scenes[scene_idx]["updated_at"] = datetime.utcnow().isoformat() + "Z"
 
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.info("Renamed preset ID %d from '%s' to '%s'", scene_id, old_name, new_name)
 
     def get_custom_scene_count(self) -> int:
@@ -13,7 +13,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BiasDataUpdateCoordinator
 from .const import (
-    COORDINATOR,
     DOMAIN,
     MANUFACTURER,
     MAX_CHANNELS,
@@ -35,7 +34,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bias select entities."""
-    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id].coordinator
 
     entities = []
 
@@ -73,7 +72,9 @@ class BiasOutputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], Sele
         """Initialize the filter type select."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_iir_{band}_type"
         self._attr_name = f"Output {channel + 1} EQ Band {band + 1} Type"
         self._attr_options = list(EQ_FILTER_TYPES.values())
@@ -90,8 +91,8 @@ class BiasOutputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], Sele
         """Return the current filter type."""
         if self.coordinator.data:
             type_value = self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("type")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("type")
             if type_value is not None:
                 return EQ_FILTER_TYPES.get(str(int(type_value)), "Peaking")
         return None
@@ -107,21 +108,10 @@ class BiasOutputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], Sele
         path = PATH_OUTPUT_IIR_TYPE.format(channel=self._channel, band=self._band)
 
         try:
-            await self.coordinator.client.write_value(path, int(type_value))
+            await self.coordinator.async_write_value(path, int(type_value))
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-
-                self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)]["type"] = int(type_value)
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(int(type_value), "output_channels", self._channel_key, "iir", self._band_key, "type")
 
         except Exception as err:
             _LOGGER.error(
@@ -147,7 +137,9 @@ class BiasPreOutputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], S
         """Initialize the filter type select."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_pre_output_{channel}_iir_{band}_type"
         self._attr_name = f"Speaker {channel + 1} EQ Band {band + 1} Type"
         self._attr_options = list(EQ_FILTER_TYPES.values())
@@ -164,8 +156,8 @@ class BiasPreOutputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], S
         """Return the current filter type."""
         if self.coordinator.data:
             type_value = self.coordinator.data.get("pre_output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("type")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("type")
             if type_value is not None:
                 return EQ_FILTER_TYPES.get(str(int(type_value)), "Peaking")
         return None
@@ -180,21 +172,10 @@ class BiasPreOutputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], S
         path = PATH_PRE_OUTPUT_IIR_TYPE.format(channel=self._channel, band=self._band)
 
         try:
-            await self.coordinator.client.write_value(path, int(type_value))
+            await self.coordinator.async_write_value(path, int(type_value))
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "pre_output_channels" not in self.coordinator.data:
-                    self.coordinator.data["pre_output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["pre_output_channels"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["pre_output_channels"][str(self._channel)]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-
-                self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)]["type"] = int(type_value)
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(int(type_value), "pre_output_channels", self._channel_key, "iir", self._band_key, "type")
 
         except Exception as err:
             _LOGGER.error(
@@ -220,7 +201,9 @@ class BiasInputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], Selec
         """Initialize the filter type select."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_iir_{band}_type"
         self._attr_name = f"Input {channel + 1} EQ Band {band + 1} Type"
         self._attr_options = list(EQ_FILTER_TYPES.values())
@@ -237,8 +220,8 @@ class BiasInputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], Selec
         """Return the current filter type."""
         if self.coordinator.data:
             type_value = self.coordinator.data.get("input_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("type")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("type")
             if type_value is not None:
                 return EQ_FILTER_TYPES.get(str(int(type_value)), "Peaking")
         return None
@@ -253,21 +236,10 @@ class BiasInputIIRTypeSelect(CoordinatorEntity[BiasDataUpdateCoordinator], Selec
         path = PATH_INPUT_ZONE_IIR_TYPE.format(channel=self._channel, band=self._band)
 
         try:
-            await self.coordinator.client.write_value(path, int(type_value))
+            await self.coordinator.async_write_value(path, int(type_value))
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["input_channels"][str(self._channel)]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["input_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-
-                self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)]["type"] = int(type_value)
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(int(type_value), "input_channels", self._channel_key, "iir", self._band_key, "type")
 
         except Exception as err:
             _LOGGER.error(
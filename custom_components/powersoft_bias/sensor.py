@@ -13,7 +13,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BiasDataUpdateCoordinator
 from .const import (
-    COORDINATOR,
     DOMAIN,
     MANUFACTURER,
     MAX_CHANNELS,
@@ -28,7 +27,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bias sensor entities."""
-    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id].coordinator
 
     entities = []
 
@@ -197,6 +196,7 @@ class BiasOutputGainRawSensor(CoordinatorEntity[BiasDataUpdateCoordinator], Sens
         """Initialize the debug sensor."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_gain_raw"
         self._attr_name = f"Output {channel + 1} Gain (Raw Linear)"
 
@@ -211,7 +211,7 @@ class BiasOutputGainRawSensor(CoordinatorEntity[BiasDataUpdateCoordinator], Sens
     def native_value(self) -> float | None:
         """Return the raw linear gain value."""
         if self.coordinator.data:
-            return self.coordinator.data.get("output_channels", {}).get(str(self._channel), {}).get("gain")
+            return self.coordinator.data.get("output_channels", {}).get(self._channel_key, {}).get("gain")
         return None
 
 
@@ -230,6 +230,7 @@ class BiasInputGainRawSensor(CoordinatorEntity[BiasDataUpdateCoordinator], Senso
         """Initialize the debug sensor."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_gain_raw"
         self._attr_name = f"Input {channel + 1} Gain (Raw Linear)"
 
@@ -244,7 +245,7 @@ class BiasInputGainRawSensor(CoordinatorEntity[BiasDataUpdateCoordinator], Senso
     def native_value(self) -> float | None:
         """Return the raw linear gain value."""
         if self.coordinator.data:
-            return self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("gain")
+            return self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("gain")
         return None
 
 
@@ -263,6 +264,7 @@ class BiasInputShadingGainRawSensor(CoordinatorEntity[BiasDataUpdateCoordinator]
         """Initialize the debug sensor."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_shading_gain_raw"
         self._attr_name = f"Input {channel + 1} Shading Gain (Raw Linear)"
 
@@ -277,5 +279,5 @@ class BiasInputShadingGainRawSensor(CoordinatorEntity[BiasDataUpdateCoordinator]
     def native_value(self) -> float | None:
         """Return the raw linear shading gain value."""
         if self.coordinator.data:
-            return self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("shading_gain")
+            return self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("shading_gain")
         return None
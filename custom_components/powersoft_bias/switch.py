@@ -13,7 +13,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BiasDataUpdateCoordinator
 from .const import (
-    COORDINATOR,
     DOMAIN,
     MANUFACTURER,
     MAX_CHANNELS,
@@ -54,7 +53,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bias switch entities."""
-    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    coordinator: BiasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id].coordinator
 
     entities = []
 
@@ -130,6 +129,7 @@ class BiasOutputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity)
         """Initialize the mute switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_mute"
         self._attr_name = f"Output {channel + 1} Mute"
 
@@ -144,7 +144,7 @@ class BiasOutputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity)
     def is_on(self) -> bool | None:
         """Return true if the channel is muted."""
         if self.coordinator.data:
-            return self.coordinator.data.get("output_channels", {}).get(str(self._channel), {}).get("mute")
+            return self.coordinator.data.get("output_channels", {}).get(self._channel_key, {}).get("mute")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -160,16 +160,10 @@ class BiasOutputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity)
         path = PATH_CHANNEL_MUTE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, mute)
+            await self.coordinator.async_write_value(path, mute)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["mute"] = mute
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(mute, "output_channels", self._channel_key, "mute")
 
         except Exception as err:
             _LOGGER.error("Failed to set output mute for channel %d: %s", self._channel, err)
@@ -191,6 +185,7 @@ class BiasOutputEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntit
         """Initialize the enable switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_enable"
         self._attr_name = f"Output {channel + 1} Enable"
 
@@ -205,7 +200,7 @@ class BiasOutputEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntit
     def is_on(self) -> bool | None:
         """Return true if the channel is enabled."""
         if self.coordinator.data:
-            return self.coordinator.data.get("output_channels", {}).get(str(self._channel), {}).get("enable")
+            return self.coordinator.data.get("output_channels", {}).get(self._channel_key, {}).get("enable")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -221,16 +216,10 @@ class BiasOutputEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntit
         path = PATH_CHANNEL_ENABLE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, enable)
+            await self.coordinator.async_write_value(path, enable)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["enable"] = enable
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(enable, "output_channels", self._channel_key, "enable")
 
         except Exception as err:
             _LOGGER.error("Failed to set output enable for channel %d: %s", self._channel, err)
@@ -252,6 +241,7 @@ class BiasOutputPolarity(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnt
         """Initialize the polarity switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_polarity"
         self._attr_name = f"Output {channel + 1} Polarity Invert"
 
@@ -266,7 +256,7 @@ class BiasOutputPolarity(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnt
     def is_on(self) -> bool | None:
         """Return true if polarity is inverted."""
         if self.coordinator.data:
-            return self.coordinator.data.get("output_channels", {}).get(str(self._channel), {}).get("polarity")
+            return self.coordinator.data.get("output_channels", {}).get(self._channel_key, {}).get("polarity")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -282,16 +272,10 @@ class BiasOutputPolarity(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnt
         path = PATH_CHANNEL_POLARITY.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, inverted)
+            await self.coordinator.async_write_value(path, inverted)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["polarity"] = inverted
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(inverted, "output_channels", self._channel_key, "polarity")
 
         except Exception as err:
             _LOGGER.error("Failed to set output polarity for channel %d: %s", self._channel, err)
@@ -313,6 +297,7 @@ class BiasOutputDelayEnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
         """Initialize the delay enable switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_delay_enable"
         self._attr_name = f"Output {channel + 1} Delay Enable"
 
@@ -327,7 +312,7 @@ class BiasOutputDelayEnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
     def is_on(self) -> bool | None:
         """Return true if delay is enabled."""
         if self.coordinator.data:
-            return self.coordinator.data.get("output_channels", {}).get(str(self._channel), {}).get("delay_enable")
+            return self.coordinator.data.get("output_channels", {}).get(self._channel_key, {}).get("delay_enable")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -343,16 +328,10 @@ class BiasOutputDelayEnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
         path = PATH_CHANNEL_OUT_DELAY_ENABLE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, enable)
+            await self.coordinator.async_write_value(path, enable)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["delay_enable"] = enable
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(enable, "output_channels", self._channel_key, "delay_enable")
 
         except Exception as err:
             _LOGGER.error("Failed to set output delay enable for channel %d: %s", self._channel, err)
@@ -377,6 +356,7 @@ class BiasInputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity):
         """Initialize the input mute switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_mute"
         self._attr_name = f"Input {channel + 1} Mute"
 
@@ -391,7 +371,7 @@ class BiasInputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity):
     def is_on(self) -> bool | None:
         """Return true if the input is muted."""
         if self.coordinator.data:
-            return self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("mute")
+            return self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("mute")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -407,16 +387,10 @@ class BiasInputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity):
         path = PATH_INPUT_MUTE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, mute)
+            await self.coordinator.async_write_value(path, mute)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["mute"] = mute
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(mute, "input_channels", self._channel_key, "mute")
 
         except Exception as err:
             _LOGGER.error("Failed to set input mute for channel %d: %s", self._channel, err)
@@ -438,6 +412,7 @@ class BiasInputEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity
         """Initialize the input enable switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_enable"
         self._attr_name = f"Input {channel + 1} Enable"
 
@@ -452,7 +427,7 @@ class BiasInputEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity
     def is_on(self) -> bool | None:
         """Return true if the input is enabled."""
         if self.coordinator.data:
-            return self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("enable")
+            return self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("enable")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -468,16 +443,10 @@ class BiasInputEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEntity
         path = PATH_INPUT_ENABLE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, enable)
+            await self.coordinator.async_write_value(path, enable)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["enable"] = enable
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(enable, "input_channels", self._channel_key, "enable")
 
         except Exception as err:
             _LOGGER.error("Failed to set input enable for channel %d: %s", self._channel, err)
@@ -499,6 +468,7 @@ class BiasInputPolarity(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnti
         """Initialize the input polarity switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_polarity"
         self._attr_name = f"Input {channel + 1} Polarity Invert"
 
@@ -513,7 +483,7 @@ class BiasInputPolarity(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnti
     def is_on(self) -> bool | None:
         """Return true if polarity is inverted."""
         if self.coordinator.data:
-            return self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("polarity")
+            return self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("polarity")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -529,16 +499,10 @@ class BiasInputPolarity(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnti
         path = PATH_INPUT_POLARITY.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, inverted)
+            await self.coordinator.async_write_value(path, inverted)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["polarity"] = inverted
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(inverted, "input_channels", self._channel_key, "polarity")
 
         except Exception as err:
             _LOGGER.error("Failed to set input polarity for channel %d: %s", self._channel, err)
@@ -560,6 +524,7 @@ class BiasInputDelayEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchE
         """Initialize the input delay enable switch."""
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_delay_enable"
         self._attr_name = f"Input {channel + 1} Delay Enable"
 
@@ -574,7 +539,7 @@ class BiasInputDelayEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchE
     def is_on(self) -> bool | None:
         """Return true if input delay is enabled."""
         if self.coordinator.data:
-            return self.coordinator.data.get("input_channels", {}).get(str(self._channel), {}).get("delay_enable")
+            return self.coordinator.data.get("input_channels", {}).get(self._channel_key, {}).get("delay_enable")
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -590,16 +555,10 @@ class BiasInputDelayEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchE
         path = PATH_INPUT_DELAY_ENABLE.format(channel=self._channel)
 
         try:
-            await self.coordinator.client.write_value(path, enable)
+            await self.coordinator.async_write_value(path, enable)
 
             # Update coordinator data immediately
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["delay_enable"] = enable
-                self.async_write_ha_state()
+            self.coordinator.async_update_local(enable, "input_channels", self._channel_key, "delay_enable")
 
         except Exception as err:
             _LOGGER.error("Failed to set input delay enable for channel %d: %s", self._channel, err)
@@ -619,7 +578,9 @@ class BiasOutputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_iir_{band}_enable"
         self._attr_name = f"Output {channel + 1} EQ Band {band + 1} Enable"
         self._attr_device_info = DeviceInfo(
@@ -633,8 +594,8 @@ class BiasOutputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("enable")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("enable")
         return None
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -647,18 +608,8 @@ class BiasOutputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
 
     async def _set_state(self, path: str, state: bool) -> None:
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["iir"][str(self._band)]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "iir", self._band_key, "enable")
         except Exception as err:
             _LOGGER.error("Failed to set output IIR enable for channel %d band %d: %s", self._channel, self._band, err)
             raise
@@ -673,7 +624,9 @@ class BiasPreOutputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switc
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_pre_output_{channel}_iir_{band}_enable"
         self._attr_name = f"Speaker {channel + 1} EQ Band {band + 1} Enable"
         self._attr_device_info = DeviceInfo(
@@ -687,8 +640,8 @@ class BiasPreOutputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switc
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("pre_output_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("enable")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("enable")
         return None
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -701,18 +654,8 @@ class BiasPreOutputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switc
 
     async def _set_state(self, path: str, state: bool) -> None:
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "pre_output_channels" not in self.coordinator.data:
-                    self.coordinator.data["pre_output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["pre_output_channels"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["pre_output_channels"][str(self._channel)]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["pre_output_channels"][str(self._channel)]["iir"][str(self._band)]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "pre_output_channels", self._channel_key, "iir", self._band_key, "enable")
         except Exception as err:
             _LOGGER.error("Failed to set pre-output IIR enable for channel %d band %d: %s", self._channel, self._band, err)
             raise
@@ -727,7 +670,9 @@ class BiasInputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnt
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_input_{channel}_iir_{band}_enable"
         self._attr_name = f"Input {channel + 1} EQ Band {band + 1} Enable"
         self._attr_device_info = DeviceInfo(
@@ -741,8 +686,8 @@ class BiasInputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnt
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("input_channels", {}).get(
-                str(self._channel), {}
-            ).get("iir", {}).get(str(self._band), {}).get("enable")
+                self._channel_key, {}
+            ).get("iir", {}).get(self._band_key, {}).get("enable")
         return None
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -755,18 +700,8 @@ class BiasInputIIREnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEnt
 
     async def _set_state(self, path: str, state: bool) -> None:
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "input_channels" not in self.coordinator.data:
-                    self.coordinator.data["input_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["input_channels"]:
-                    self.coordinator.data["input_channels"][str(self._channel)] = {}
-                if "iir" not in self.coordinator.data["input_channels"][str(self._channel)]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"] = {}
-                if str(self._band) not in self.coordinator.data["input_channels"][str(self._channel)]["iir"]:
-                    self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)] = {}
-                self.coordinator.data["input_channels"][str(self._channel)]["iir"][str(self._band)]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "input_channels", self._channel_key, "iir", self._band_key, "enable")
         except Exception as err:
             _LOGGER.error("Failed to set input IIR enable for channel %d band %d: %s", self._channel, self._band, err)
             raise
@@ -785,6 +720,7 @@ class BiasClipLimiterEnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
     def __init__(self, coordinator, entry, channel: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_clip_limiter_enable"
         self._attr_name = f"Output {channel + 1} Clip Limiter"
         self._attr_device_info = DeviceInfo(
@@ -798,7 +734,7 @@ class BiasClipLimiterEnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("clip", {}).get("enable")
         return None
 
@@ -811,18 +747,8 @@ class BiasClipLimiterEnable(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
     async def _set_state(self, state: bool) -> None:
         path = PATH_LIMITER_CLIP_ENABLE.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "clip" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clip"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clip"]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "limiters", "clip", "enable")
         except Exception as err:
             _LOGGER.error("Failed to set clip limiter enable for channel %d: %s", self._channel, err)
             raise
@@ -840,25 +766,15 @@ class BiasPeakLimiterEnable(BiasClipLimiterEnable):
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("peak", {}).get("enable")
         return None
 
     async def _set_state(self, state: bool) -> None:
         path = PATH_LIMITER_PEAK_ENABLE.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "peak" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["peak"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["peak"]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "limiters", "peak", "enable")
         except Exception as err:
             _LOGGER.error("Failed to set peak limiter enable for channel %d: %s", self._channel, err)
             raise
@@ -875,25 +791,15 @@ class BiasVRMSLimiterEnable(BiasClipLimiterEnable):
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("vrms", {}).get("enable")
         return None
 
     async def _set_state(self, state: bool) -> None:
         path = PATH_LIMITER_VRMS_ENABLE.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "vrms" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["vrms"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["vrms"]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "limiters", "vrms", "enable")
         except Exception as err:
             _LOGGER.error("Failed to set VRMS limiter enable for channel %d: %s", self._channel, err)
             raise
@@ -910,25 +816,15 @@ class BiasIRMSLimiterEnable(BiasClipLimiterEnable):
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("irms", {}).get("enable")
         return None
 
     async def _set_state(self, state: bool) -> None:
         path = PATH_LIMITER_IRMS_ENABLE.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "irms" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["irms"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["irms"]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "limiters", "irms", "enable")
         except Exception as err:
             _LOGGER.error("Failed to set IRMS limiter enable for channel %d: %s", self._channel, err)
             raise
@@ -945,25 +841,15 @@ class BiasClampLimiterEnable(BiasClipLimiterEnable):
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("clamp", {}).get("enable")
         return None
 
     async def _set_state(self, state: bool) -> None:
         path = PATH_LIMITER_CLAMP_ENABLE.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "clamp" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clamp"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["clamp"]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "limiters", "clamp", "enable")
         except Exception as err:
             _LOGGER.error("Failed to set clamp limiter enable for channel %d: %s", self._channel, err)
             raise
@@ -980,25 +866,15 @@ class BiasThermalLimiterEnable(BiasClipLimiterEnable):
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("thermal", {}).get("enable")
         return None
 
     async def _set_state(self, state: bool) -> None:
         path = PATH_LIMITER_THERMAL_ENABLE.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "thermal" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["thermal"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["thermal"]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "limiters", "thermal", "enable")
         except Exception as err:
             _LOGGER.error("Failed to set thermal limiter enable for channel %d: %s", self._channel, err)
             raise
@@ -1015,25 +891,15 @@ class BiasTruePowerLimiterEnable(BiasClipLimiterEnable):
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("output_channels", {}).get(
-                str(self._channel), {}
+                self._channel_key, {}
             ).get("limiters", {}).get("truepower", {}).get("enable")
         return None
 
     async def _set_state(self, state: bool) -> None:
         path = PATH_LIMITER_TRUEPOWER_ENABLE.format(channel=self._channel)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "output_channels" not in self.coordinator.data:
-                    self.coordinator.data["output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["output_channels"]:
-                    self.coordinator.data["output_channels"][str(self._channel)] = {}
-                if "limiters" not in self.coordinator.data["output_channels"][str(self._channel)]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"] = {}
-                if "truepower" not in self.coordinator.data["output_channels"][str(self._channel)]["limiters"]:
-                    self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["truepower"] = {}
-                self.coordinator.data["output_channels"][str(self._channel)]["limiters"]["truepower"]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "output_channels", self._channel_key, "limiters", "truepower", "enable")
         except Exception as err:
             _LOGGER.error("Failed to set truepower limiter enable for channel %d: %s", self._channel, err)
             raise
@@ -1052,7 +918,9 @@ class BiasCrossoverEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     def __init__(self, coordinator, entry, channel: int, band: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._band = band
+        self._band_key = str(band)
         self._attr_unique_id = f"{entry.entry_id}_output_{channel}_xover_{band}_enable"
         self._attr_name = f"Output {channel + 1} Crossover Band {band + 1}"
         self._attr_device_info = DeviceInfo(
@@ -1066,8 +934,8 @@ class BiasCrossoverEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("pre_output_channels", {}).get(
-                str(self._channel), {}
-            ).get("crossover", {}).get(str(self._band), {}).get("enable")
+                self._channel_key, {}
+            ).get("crossover", {}).get(self._band_key, {}).get("enable")
         return None
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -1079,18 +947,8 @@ class BiasCrossoverEnable(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     async def _set_state(self, state: bool) -> None:
         path = PATH_XOVER_ENABLE.format(channel=self._channel, band=self._band)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "pre_output_channels" not in self.coordinator.data:
-                    self.coordinator.data["pre_output_channels"] = {}
-                if str(self._channel) not in self.coordinator.data["pre_output_channels"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)] = {}
-                if "crossover" not in self.coordinator.data["pre_output_channels"][str(self._channel)]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"] = {}
-                if str(self._band) not in self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"]:
-                    self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"][str(self._band)] = {}
-                self.coordinator.data["pre_output_channels"][str(self._channel)]["crossover"][str(self._band)]["enable"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "pre_output_channels", self._channel_key, "crossover", self._band_key, "enable")
         except Exception as err:
             _LOGGER.error("Failed to set crossover enable for channel %d band %d: %s", self._channel, self._band, err)
             raise
@@ -1109,6 +967,7 @@ class BiasMatrixInputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     def __init__(self, coordinator, entry, input_ch: int) -> None:
         super().__init__(coordinator)
         self._input_ch = input_ch
+        self._input_ch_key = str(input_ch)
         self._attr_unique_id = f"{entry.entry_id}_matrix_input_{input_ch}_mute"
         self._attr_name = f"Matrix Input {input_ch + 1} Mute"
         self._attr_device_info = DeviceInfo(
@@ -1121,7 +980,7 @@ class BiasMatrixInputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     @property
     def is_on(self) -> bool | None:
         if self.coordinator.data:
-            return self.coordinator.data.get("matrix", {}).get("inputs", {}).get(str(self._input_ch), {}).get("mute")
+            return self.coordinator.data.get("matrix", {}).get("inputs", {}).get(self._input_ch_key, {}).get("mute")
         return None
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -1133,16 +992,8 @@ class BiasMatrixInputMute(CoordinatorEntity[BiasDataUpdateCoordinator], SwitchEn
     async def _set_state(self, state: bool) -> None:
         path = PATH_MATRIX_IN_MUTE.format(input=self._input_ch)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "matrix" not in self.coordinator.data:
-                    self.coordinator.data["matrix"] = {}
-                if "inputs" not in self.coordinator.data["matrix"]:
-                    self.coordinator.data["matrix"]["inputs"] = {}
-                if str(self._input_ch) not in self.coordinator.data["matrix"]["inputs"]:
-                    self.coordinator.data["matrix"]["inputs"][str(self._input_ch)] = {}
-                self.coordinator.data["matrix"]["inputs"][str(self._input_ch)]["mute"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "matrix", "inputs", self._input_ch_key, "mute")
         except Exception as err:
             _LOGGER.error("Failed to set matrix input mute for input %d: %s", self._input_ch, err)
             raise
@@ -1157,7 +1008,9 @@ class BiasMatrixChannelMute(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
     def __init__(self, coordinator, entry, channel: int, input_ch: int) -> None:
         super().__init__(coordinator)
         self._channel = channel
+        self._channel_key = str(channel)
         self._input_ch = input_ch
+        self._input_ch_key = str(input_ch)
         self._attr_unique_id = f"{entry.entry_id}_matrix_ch{channel}_in{input_ch}_mute"
         self._attr_name = f"Matrix Output {channel + 1} Input {input_ch + 1} Mute"
         self._attr_device_info = DeviceInfo(
@@ -1171,8 +1024,8 @@ class BiasMatrixChannelMute(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
     def is_on(self) -> bool | None:
         if self.coordinator.data:
             return self.coordinator.data.get("matrix", {}).get("channels", {}).get(
-                str(self._channel), {}
-            ).get("routing", {}).get(str(self._input_ch), {}).get("mute")
+                self._channel_key, {}
+            ).get("routing", {}).get(self._input_ch_key, {}).get("mute")
         return None
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -1184,20 +1037,8 @@ class BiasMatrixChannelMute(CoordinatorEntity[BiasDataUpdateCoordinator], Switch
     async def _set_state(self, state: bool) -> None:
         path = PATH_MATRIX_CHANNEL_MUTE.format(channel=self._channel, input=self._input_ch)
         try:
-            await self.coordinator.client.write_value(path, state)
-            if self.coordinator.data:
-                if "matrix" not in self.coordinator.data:
-                    self.coordinator.data["matrix"] = {}
-                if "channels" not in self.coordinator.data["matrix"]:
-                    self.coordinator.data["matrix"]["channels"] = {}
-                if str(self._channel) not in self.coordinator.data["matrix"]["channels"]:
-                    self.coordinator.data["matrix"]["channels"][str(self._channel)] = {}
-                if "routing" not in self.coordinator.data["matrix"]["channels"][str(self._channel)]:
-                    self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"] = {}
-                if str(self._input_ch) not in self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"]:
-                    self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"][str(self._input_ch)] = {}
-                self.coordinator.data["matrix"]["channels"][str(self._channel)]["routing"][str(self._input_ch)]["mute"] = state
-                self.async_write_ha_state()
+            await self.coordinator.async_write_value(path, state)
+            self.coordinator.async_update_local(state, "matrix", "channels", self._channel_key, "routing", self._input_ch_key, "mute")
         except Exception as err:
             _LOGGER.error("Failed to set matrix channel mute for channel %d input %d: %s", self._channel, self._input_ch, err)
             raise
@@ -3,16 +3,18 @@ import logging
 
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
 
 from .const import (
     DOMAIN,
     MANUFACTURER,
-    SCENE_MANAGER,
+    SIGNAL_SCENES_UPDATED,
     UID_SCENE,
 )
+from .entity import async_sync_scene_entities
 from .scene_manager import SceneManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,27 +26,52 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bias text entities."""
-    scene_manager: SceneManager = hass.data[DOMAIN][entry.entry_id][SCENE_MANAGER]
+    scene_manager: SceneManager = hass.data[DOMAIN][entry.entry_id].scene_manager
 
-    entities = []
+    # Rename entities keyed by scene ID, so preset edits can be applied
+    # in place instead of reloading the integration
+    scene_entities: dict[int, list[BiasSceneRenameText]] = {}
 
-    # Get all scenes
-    scenes = scene_manager.get_all_scenes()
-
-    # Create rename text entities for each scene
-    for scene in scenes:
-        entities.append(
+    def _create_scene_entities(scene: dict) -> list[BiasSceneRenameText]:
+        """Create the rename entity for one preset."""
+        return [
             BiasSceneRenameText(
                 scene_manager,
                 entry,
                 scene,
                 hass,
             )
-        )
+        ]
+
+    # Get all scenes
+    scenes = scene_manager.get_all_scenes()
+
+    # Create rename text entities for each scene
+    entities: list[BiasSceneRenameText] = []
+    for scene in scenes:
+        scene_entities[scene["id"]] = _create_scene_entities(scene)
+        entities.extend(scene_entities[scene["id"]])
 
     async_add_entities(entities)
     _LOGGER.info("Added %d text entities (scene rename)", len(entities))
 
+    @callback
+    def _async_sync_scenes() -> None:
+        """Add, remove and refresh rename entities to match the scene manager."""
+        async_sync_scene_entities(
+            hass,
+            scene_entities,
+            scene_manager.get_all_scenes(),
+            _create_scene_entities,
+            async_add_entities,
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_SCENES_UPDATED.format(entry_id=entry.entry_id), _async_sync_scenes
+        )
+    )
+
 
 class BiasSceneRenameText(TextEntity):
     """Text entity to rename a scene."""
@@ -77,6 +104,15 @@ class BiasSceneRenameText(TextEntity):
         self._attr_unique_id = f"{entry.entry_id}_{UID_SCENE}_{scene_config['id']}_rename"
         self._attr_name = f"Rename {scene_config['name']}"
 
+    @callback
+    def async_update_scene(self, scene_config: dict) -> None:
+        """Refresh the entity after its preset was updated or renamed."""
+        self._scene_config = scene_config
+        self._attr_name = f"Rename {scene_config['name']}"
+        # Entities never added to hass (e.g. disabled ones) have no state
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     @property
     def native_value(self) -> str:
         """Return the current scene name."""
@@ -116,8 +152,8 @@ class BiasSceneRenameText(TextEntity):
 
             _LOGGER.info("Successfully renamed scene to '%s'", new_name)
 
-            # Reload integration to refresh all entities with new name
-            await self._hass.config_entries.async_reload(self._entry.entry_id)
+            # Refresh preset entities with the new name in place
+            await self._hass.data[DOMAIN][self._entry.entry_id].scene_sync_debouncer.async_call()
 
         except ValueError as err:
             _LOGGER.error("Failed to rename scene: %s", err)